@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from .models import User
+from .search import search_users
 
 # Customize site titles
 admin.site.site_header = "Assembly Tours Admin Dashboard"
@@ -47,10 +48,15 @@ class CustomUserAdmin(UserAdmin):
         "get_profile_picture_safe", "is_staff", "is_active"
     )
 
-    # Add search fields
+    # Add search fields (matched through UserSearchToken, see get_search_results)
     search_fields = ("email", "username", "phone", "first_name", "last_name")
     ordering = ("email",)
 
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return search_users(search_term, queryset), False
+
     # -------------------------------
     # Helper methods to handle nulls
     # -------------------------------
@@ -0,0 +1,137 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from core.cache import shared_cache
+
+User = get_user_model()
+
+AUTH_USER_VERSION_KEY = "accounts:auth-user-version:{}"
+
+# Columns every request may need from request.user; anything else on the
+# wide user row is loaded lazily if a view asks for it
+AUTH_USER_FIELDS = {
+    "id",
+    "username",
+    "email",
+    "phone",
+    "first_name",
+    "last_name",
+    "profile_picture",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+}
+
+# Model.from_db expects values in concrete field order
+SNAPSHOT_COLUMNS = tuple(
+    field.attname for field in User._meta.concrete_fields if field.attname in AUTH_USER_FIELDS
+)
+
+
+# This worker's snapshots: user_id -> (values, version, loaded_at, checked_at),
+# least recently used first
+_snapshots = OrderedDict()
+_lock = threading.Lock()
+
+
+def _version(user_id):
+    return shared_cache.get(AUTH_USER_VERSION_KEY.format(user_id), 0)
+
+
+def invalidate_auth_user(user_id):
+    """
+    Drop this worker's snapshot and move the user to a new version in the
+    shared cache, so other workers drop theirs within
+    AUTH_USER_VERSION_CHECK_SECONDS.
+    """
+    with _lock:
+        _snapshots.pop(user_id, None)
+
+    key = AUTH_USER_VERSION_KEY.format(user_id)
+    try:
+        shared_cache.incr(key)
+    except ValueError:
+        shared_cache.set(key, 1, None)
+
+
+def load_auth_user(user_id):
+    """
+    A ``User`` built from this worker's slim snapshot, with the remaining
+    fields deferred. A fresh snapshot costs nothing; the shared version is
+    read at most once per AUTH_USER_VERSION_CHECK_SECONDS, and the row only
+    when the snapshot is missing, expired or outdated. Returns None for
+    unknown ids.
+    """
+    now = time.monotonic()
+
+    with _lock:
+        entry = _snapshots.get(user_id)
+    if entry is not None:
+        values, version, loaded_at, checked_at = entry
+        if now - loaded_at < settings.AUTH_USER_CACHE_TTL:
+            if now - checked_at >= settings.AUTH_USER_VERSION_CHECK_SECONDS:
+                if _version(user_id) != version:
+                    values = None
+                checked_at = now
+            if values is not None:
+                with _lock:
+                    _snapshots[user_id] = (values, version, loaded_at, checked_at)
+                    _snapshots.move_to_end(user_id)
+                return User.from_db(DEFAULT_DB_ALIAS, SNAPSHOT_COLUMNS, values)
+
+    # Read the version first: a save racing with the SELECT below leaves a
+    # newer version behind, which the next check notices
+    version = _version(user_id)
+    values = User.objects.filter(pk=user_id).values_list(*SNAPSHOT_COLUMNS).first()
+    if values is None:
+        return None
+
+    with _lock:
+        _snapshots[user_id] = (values, version, now, now)
+        _snapshots.move_to_end(user_id)
+        while len(_snapshots) > settings.AUTH_USER_CACHE_SIZE:
+            _snapshots.popitem(last=False)
+
+    return User.from_db(DEFAULT_DB_ALIAS, SNAPSHOT_COLUMNS, values)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves ``request.user`` from a short-lived
+    per-worker snapshot instead of selecting the whole user row per request.
+
+    Saves and deletes through the ORM reach the saving worker at once and
+    the others within AUTH_USER_VERSION_CHECK_SECONDS. Writes that send
+    no signal (``QuerySet.update()``, raw SQL) are picked up within
+    AUTH_USER_CACHE_TTL seconds, so keep that short.
+    """
+
+    def get_user(self, validated_token):
+        # Revocation compares password hashes, which are never cached
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        user = load_auth_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+User = get_user_model()
+
+AUTHOR_CARD_CACHE_KEY = "accounts:author-card:{}"
+AUTHOR_CARD_TTL = 60 * 60
+
+DELETED_AUTHOR_CARD = {"name": "Deleted User", "avatar_url": None}
+
+# The only columns a card needs, so the wide user row is never fetched
+AUTHOR_CARD_FIELDS = ("id", "username", "phone", "first_name", "last_name", "profile_picture")
+
+
+def build_author_card(user):
+    """
+    Public ``{name, avatar_url}`` card shown next to a user's comments.
+    Falls back to a ui-avatars.com image when there is no profile picture.
+    """
+    name = user.username or user.phone or "Anonymous"
+
+    if user.profile_picture:
+        avatar_url = user.profile_picture
+    else:
+        avatar_name = user.get_full_name() or user.username or "User"
+        avatar_url = (
+            f"https://ui-avatars.com/api/?name={avatar_name.replace(' ', '+')}"
+            "&background=random"
+        )
+
+    return {"name": name, "avatar_url": avatar_url}
+
+
+def load_author_cards(user_ids):
+    """
+    Cards for every id in ``user_ids``, read from the cache with a single
+    query for the misses. Unknown ids get the deleted-user card.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id}
+    keys = {AUTHOR_CARD_CACHE_KEY.format(user_id): user_id for user_id in user_ids}
+
+    cards = {keys[key]: card for key, card in cache.get_many(keys).items()}
+
+    missing = user_ids - cards.keys()
+    if missing:
+        fresh = {
+            user.pk: build_author_card(user)
+            for user in User.objects.filter(pk__in=missing).only(*AUTHOR_CARD_FIELDS)
+        }
+        cache.set_many(
+            {AUTHOR_CARD_CACHE_KEY.format(user_id): card for user_id, card in fresh.items()},
+            AUTHOR_CARD_TTL,
+        )
+        cards.update(fresh)
+
+    for user_id in missing - cards.keys():
+        cards[user_id] = DELETED_AUTHOR_CARD
+    return cards
+
+
+def invalidate_author_card(user_id):
+    cache.delete(AUTHOR_CARD_CACHE_KEY.format(user_id))
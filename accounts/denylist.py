@@ -0,0 +1,117 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+
+from core.cache import shared_cache
+
+DENIED_JTI_CACHE_KEY = "accounts:denied-jti:{}"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings. No false negatives; the false
+    positive rate depends on how full it gets (see JWT_DENYLIST_* settings).
+    """
+
+    def __init__(self, bits, hashes):
+        self.bits = bits
+        self.hashes = hashes
+        self.array = bytearray((bits + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return ((first + i * second) % self.bits for i in range(self.hashes))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.array[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.array[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class DenylistBucket:
+    """
+    Denied jti values of tokens expiring within one time bucket. Recent
+    entries sit in an exact set; once it grows past its limit they are
+    folded into the Bloom filter, which has constant size.
+    """
+
+    def __init__(self):
+        self.recent = set()
+        self.bloom = None
+
+    def add(self, jti):
+        self.recent.add(jti)
+        if len(self.recent) >= settings.JWT_DENYLIST_EXACT_LIMIT:
+            if self.bloom is None:
+                self.bloom = BloomFilter(
+                    settings.JWT_DENYLIST_BLOOM_BITS, settings.JWT_DENYLIST_BLOOM_HASHES
+                )
+            for value in self.recent:
+                self.bloom.add(value)
+            self.recent = set()
+
+    def __contains__(self, jti):
+        return jti in self.recent or (self.bloom is not None and jti in self.bloom)
+
+
+class TokenDenylist:
+    """
+    Used refresh-token jti values, partitioned by the token's expiry.
+
+    A bucket covers JWT_DENYLIST_BUCKET_SECONDS of expiry times and is
+    dropped as a whole once all its tokens have expired, since expired
+    tokens are rejected before the denylist is consulted. Memory is thus
+    bounded by the refresh token lifetime.
+
+    The buckets are a per-process front: a jti this worker has denied is
+    rejected without leaving the process. With JWT_DENYLIST_SHARED (on
+    when Redis backs the shared cache) each claim also ends in an atomic
+    ``shared_cache.add``, so reuse is caught on any worker and after a
+    restart, and two concurrent refreshes of one token cannot both
+    succeed. Without it the buckets are all there is: no cache or
+    database round trip per refresh, but a used token can be replayed
+    once on each other worker and after every restart, until it expires.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _bucket_of(self, exp):
+        return int(exp) // settings.JWT_DENYLIST_BUCKET_SECONDS
+
+    def _drop_expired(self, now):
+        current = self._bucket_of(now)
+        for bucket in [bucket for bucket in self._buckets if bucket < current]:
+            del self._buckets[bucket]
+
+    def _remember(self, jti, exp):
+        self._buckets.setdefault(self._bucket_of(exp), DenylistBucket()).add(jti)
+
+    def claim(self, jti, exp):
+        """
+        Deny ``jti`` (expiring at ``exp``, a unix timestamp). Returns False
+        if it was already denied, i.e. the token has been used before.
+        """
+        now = time.time()
+        with self._lock:
+            self._drop_expired(now)
+
+            bucket = self._buckets.get(self._bucket_of(exp))
+            if bucket is not None and jti in bucket:
+                return False
+
+            self._remember(jti, exp)
+            if settings.JWT_DENYLIST_SHARED:
+                timeout = max(int(exp - now), 1)
+                return shared_cache.add(DENIED_JTI_CACHE_KEY.format(jti), 1, timeout)
+            return True
+
+
+token_denylist = TokenDenylist()
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+# Work factors are read when the hasher is built, so every environment sets
+# its own cost through settings. A stored hash whose parameters differ from
+# the policy is re-encoded on the next successful login (check_password's
+# setter), whether the policy went up or down.
+
+
+class PolicyPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with PASSWORD_HASH_ITERATIONS iterations."""
+
+    def __init__(self):
+        self.iterations = settings.PASSWORD_HASH_ITERATIONS or self.iterations
+
@@ -0,0 +1,94 @@
+import os
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+User = get_user_model()
+
+PASSWORD = "benchmark-password-123"
+
+
+def parse_policy(spec):
+    """
+    ``algorithm[:name=value,...]``, e.g. ``pbkdf2_sha256:iterations=600000``
+    or ``scrypt:work_factor=16384``. Returns a hasher instance with those
+    costs.
+    """
+    algorithm, _, params = spec.partition(":")
+    try:
+        hasher = type(get_hasher(algorithm))()
+    except ValueError:
+        raise CommandError(f"Unknown hasher {algorithm!r}, see PASSWORD_HASHERS")
+
+    for param in filter(None, params.split(",")):
+        name, _, value = param.partition("=")
+        if not hasattr(hasher, name):
+            raise CommandError(f"{algorithm} has no {name!r} parameter")
+        setattr(hasher, name, int(value))
+    return hasher
+
+
+def describe(hasher):
+    params = hasher.decode(hasher.encode(PASSWORD, hasher.salt()))
+    shown = {key: value for key, value in params.items() if key not in ("algorithm", "hash", "salt")}
+    return ", ".join(f"{key}={value}" for key, value in shown.items())
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure logins per second on one core for each password hashing policy "
+        "(hash check plus token issue, no database)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "policies",
+            nargs="*",
+            help="algorithm[:name=value,...]; defaults to the configured policy",
+        )
+        parser.add_argument(
+            "--seconds",
+            type=float,
+            default=3,
+            help="Minimum time spent measuring each policy",
+        )
+        parser.add_argument(
+            "--target",
+            type=float,
+            help="Logins per second to size for; reports the cores each policy needs",
+        )
+
+    def handle(self, *args, **options):
+        specs = options["policies"] or [settings.PASSWORD_HASH_ALGORITHM]
+        policies = [(spec, parse_policy(spec)) for spec in specs]
+        user = User(pk="benchmark", phone="+2340000000000")
+
+        self.stdout.write(f"{os.cpu_count()} cores available, measuring one")
+        for spec, hasher in policies:
+            try:
+                encoded = hasher.encode(PASSWORD, hasher.salt())
+            except ValueError as e:
+                # e.g. an OpenSSL build without scrypt
+                self.stdout.write(self.style.WARNING(f"{spec}: unavailable ({e})"))
+                continue
+
+            logins = 0
+            started = time.perf_counter()
+            while True:
+                if not hasher.verify(PASSWORD, encoded):
+                    raise CommandError(f"{spec}: password did not verify")
+                RefreshToken.for_user(user)
+                logins += 1
+                elapsed = time.perf_counter() - started
+                if elapsed >= options["seconds"]:
+                    break
+
+            rate = logins / elapsed
+            line = f"{hasher.algorithm} ({describe(hasher)}): {1000 / rate:.1f} ms/login, {rate:.1f} logins/s/core"
+            if options["target"]:
+                line += f", {options['target'] / rate:.1f} cores for {options['target']:g}/s"
+            self.stdout.write(line)
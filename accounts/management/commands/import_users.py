@@ -0,0 +1,225 @@
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from accounts.search import index_users
+from accounts.validators import validate_nigerian_phone
+
+User = get_user_model()
+
+# Columns read from the file; anything else is ignored
+IMPORT_FIELDS = (
+    "phone",
+    "email",
+    "username",
+    "password",
+    "first_name",
+    "last_name",
+    "gender",
+    "date_of_birth",
+    "nationality",
+    "state_of_origin",
+    "passport_number",
+    "passport_expiry",
+    "address",
+    "emergency_contact_name",
+    "emergency_contact_phone",
+)
+
+# Unique columns checked against the file itself and the database
+UNIQUE_FIELDS = ("phone", "email", "username", "passport_number")
+
+
+def _init_worker():
+    # Spawned/forkserver workers start without configured settings
+    django.setup()
+
+
+def load_json_row(line):
+    """One JSONL line as a dict; ValueError if it is not a JSON object."""
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON ({e.msg})")
+    if not isinstance(row, dict):
+        raise ValueError(f"expected a JSON object, got {type(row).__name__}")
+    return row
+
+
+def read_rows(path):
+    """
+    Yield (line number, row) from a .csv or .jsonl file, lazily. JSONL
+    rows are yielded as raw lines, parsed by ``clean_row``, so one bad
+    line is reported like any other invalid row.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+    elif suffix in (".jsonl", ".ndjson"):
+        with path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield line_number, line
+    else:
+        raise CommandError(f"Unsupported file type {suffix!r}, expected .csv or .jsonl")
+
+
+def clean_row(row):
+    """
+    Importable, stripped values of ``row`` with blanks dropped. Raises
+    ValueError with a readable reason for rows that cannot be imported.
+    """
+    if isinstance(row, str):
+        row = load_json_row(row)
+
+    values = {}
+    for field in IMPORT_FIELDS:
+        value = row.get(field)
+        if value is None:
+            continue
+        value = str(value).strip()
+        if value:
+            values[field] = value
+
+    if "phone" not in values:
+        raise ValueError("phone is required")
+    validate_nigerian_phone(values["phone"])
+
+    if "email" in values:
+        values["email"] = User.objects.normalize_email(values["email"])
+
+    # Lengths, choices, email and date formats, as the model field sees them
+    for field, value in values.items():
+        if field == "password":
+            continue
+        try:
+            values[field] = User._meta.get_field(field).clean(value, None)
+        except ValidationError as e:
+            raise ValueError(f"{field}: {' '.join(e.messages)}")
+
+    return values
+
+
+class Command(BaseCommand):
+    help = "Import users from a CSV or JSONL file, hashing passwords in parallel"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="A .csv (with a header row) or .jsonl file")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Users validated, hashed and inserted together",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Password hashing processes (default: one per core)",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.is_file():
+            raise CommandError(f"{path} does not exist")
+
+        self.seen = {field: set() for field in UNIQUE_FIELDS}
+        self.created = 0
+        self.rejected = 0
+
+        with ProcessPoolExecutor(max_workers=options["workers"], initializer=_init_worker) as pool:
+            self.pool = pool
+            self.workers = options["workers"]
+
+            batch = []
+            for line_number, row in read_rows(path):
+                try:
+                    batch.append((line_number, clean_row(row)))
+                except ValueError as e:
+                    self.reject(line_number, str(e))
+                    continue
+
+                if len(batch) >= options["batch_size"]:
+                    self.import_batch(batch)
+                    batch = []
+            if batch:
+                self.import_batch(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {self.created} users, rejected {self.rejected}")
+        )
+
+    def reject(self, line_number, reason):
+        self.rejected += 1
+        self.stdout.write(self.style.WARNING(f"line {line_number}: {reason}"))
+
+    def import_batch(self, batch):
+        # Conflicts with earlier rows of the file, then with existing users
+        rows = []
+        for line_number, values in batch:
+            duplicate = next(
+                (field for field in UNIQUE_FIELDS if values.get(field) in self.seen[field]), None
+            )
+            if duplicate:
+                self.reject(line_number, f"{duplicate} {values[duplicate]!r} repeats an earlier row")
+                continue
+            for field in UNIQUE_FIELDS:
+                if field in values:
+                    self.seen[field].add(values[field])
+            rows.append((line_number, values))
+
+        existing = {}
+        for field in UNIQUE_FIELDS:
+            wanted = [values[field] for _, values in rows if field in values]
+            if wanted:
+                taken = User.objects.filter(**{f"{field}__in": wanted})
+                existing[field] = set(taken.values_list(field, flat=True))
+
+        accepted = []
+        for line_number, values in rows:
+            conflict = next(
+                (field for field in existing if values.get(field) in existing[field]), None
+            )
+            if conflict:
+                self.reject(line_number, f"{conflict} {values[conflict]!r} already exists")
+            else:
+                accepted.append((line_number, values))
+        if not accepted:
+            return
+
+        # PBKDF2 is the slow part; spread it over the pool
+        passwords = [values.pop("password", None) for _, values in accepted]
+        chunksize = max(len(passwords) // (self.workers * 4), 1)
+        hashes = self.pool.map(make_password, passwords, chunksize=chunksize)
+
+        users = [
+            (line_number, User(password=password_hash, **values))
+            for (line_number, values), password_hash in zip(accepted, hashes)
+        ]
+
+        try:
+            with transaction.atomic():
+                # bulk_create sends no post_save, so index here
+                index_users(User.objects.bulk_create([user for _, user in users]))
+            self.created += len(users)
+        except IntegrityError:
+            # Someone else inserted a clashing user meanwhile; find it row by row
+            for line_number, user in users:
+                try:
+                    with transaction.atomic():
+                        user.save(force_insert=True)
+                    self.created += 1
+                except IntegrityError as e:
+                    self.reject(line_number, f"conflicts with an existing user ({e})")
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from accounts.search import SEARCH_FIELDS, user_tokens
+
+
+def index_existing_users(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    UserSearchToken = apps.get_model("accounts", "UserSearchToken")
+
+    tokens = (
+        UserSearchToken(user_id=user.pk, token=token)
+        for user in User.objects.only("pk", *SEARCH_FIELDS).iterator()
+        for token in user_tokens(user)
+    )
+    UserSearchToken.objects.bulk_create(tokens, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_alter_user_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=150)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['token', 'user'], name='accounts_search_token_idx')],
+            },
+        ),
+        migrations.RunPython(index_existing_users, migrations.RunPython.noop),
+    ]
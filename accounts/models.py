@@ -121,3 +121,24 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.email
+
+
+# ---------------------------
+# Search tokens (staff search)
+# ---------------------------
+class UserSearchToken(models.Model):
+    """
+    One normalized word of a user's name, username or email, or a form of
+    their phone number. Kept in sync by accounts.signals; staff search
+    matches prefixes with index range scans instead of icontains.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='search_tokens')
+    token = models.CharField(max_length=150)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['token', 'user'], name='accounts_search_token_idx'),
+        ]
+
+    def __str__(self):
+        return self.token
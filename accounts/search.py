@@ -0,0 +1,91 @@
+import re
+import unicodedata
+
+from django.contrib.auth import get_user_model
+
+from .models import UserSearchToken
+
+User = get_user_model()
+
+# Saving any of these re-indexes the user
+SEARCH_FIELDS = {"email", "username", "phone", "first_name", "last_name"}
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+PHONE_QUERY_RE = re.compile(r"^\+?[\d\s().-]+$")
+
+COUNTRY_CODE = "234"
+TOKEN_LENGTH = UserSearchToken._meta.get_field("token").max_length
+
+
+def words(text):
+    """Lowercase word tokens with accents folded (``Adébáyọ̀`` -> ``adebayo``)."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return TOKEN_RE.findall(folded.lower())
+
+
+def normalize_phone(value):
+    """
+    Digits of a Nigerian number in E.164 form without the ``+``
+    (``0803 123 4567`` -> ``2348031234567``). Partial numbers are
+    normalized the same way, so they can be used as prefixes.
+    """
+    value = (value or "").strip()
+    digits = re.sub(r"\D", "", value)
+    if value.startswith("+") or digits.startswith(COUNTRY_CODE):
+        return digits
+    if digits.startswith("0"):
+        return COUNTRY_CODE + digits[1:]
+    return digits
+
+
+def user_tokens(user):
+    tokens = set()
+    for field in ("username", "first_name", "last_name", "email"):
+        tokens.update(words(getattr(user, field)))
+
+    phone = normalize_phone(user.phone)
+    if phone:
+        tokens.add(phone)
+        if phone.startswith(COUNTRY_CODE):
+            # National number, so "803..." finds "+234803..." too
+            tokens.add(phone[len(COUNTRY_CODE):])
+    return {token[:TOKEN_LENGTH] for token in tokens}
+
+
+def index_users(users):
+    """Replace the search tokens of ``users`` (saved User instances)."""
+    users = list(users)
+    UserSearchToken.objects.filter(user__in=users).delete()
+    UserSearchToken.objects.bulk_create(
+        UserSearchToken(user=user, token=token) for user in users for token in user_tokens(user)
+    )
+
+
+def query_terms(query):
+    """
+    Prefixes a query must match. A query that looks like a phone number
+    is one term, normalized like stored numbers; otherwise every word is
+    a term.
+    """
+    if PHONE_QUERY_RE.match(query.strip()):
+        phone = normalize_phone(query)
+        return [phone] if phone else []
+    return words(query)
+
+
+def search_users(query, queryset=None):
+    """
+    Users having a token starting with each term of ``query``. Each term
+    is one range scan on the token index.
+    """
+    queryset = User.objects.all() if queryset is None else queryset
+    terms = query_terms(query)
+    if not terms:
+        return queryset.none()
+
+    for term in terms:
+        term = term[:TOKEN_LENGTH]
+        matching = UserSearchToken.objects.filter(token__gte=term, token__lt=term + "\uffff")
+        queryset = queryset.filter(pk__in=matching.values("user_id"))
+    return queryset
@@ -68,3 +68,16 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "emergency_contact_name",
             "emergency_contact_phone",
         ]
+
+
+# ───────────────────────────────
+# Staff User Search Serializer
+# ───────────────────────────────
+USER_SEARCH_FIELDS = ["id", "username", "email", "phone", "first_name", "last_name", "profile_picture"]
+
+
+class UserSearchResultSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = USER_SEARCH_FIELDS
+        read_only_fields = fields
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .authentication import invalidate_auth_user
+from .cards import invalidate_author_card
+from .models import User
+from .search import SEARCH_FIELDS, index_users
+
+
+# --------------------------------------
+# DROP CACHED AUTHOR CARDS ON CHANGE
+# --------------------------------------
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def refresh_author_card(sender, instance, **kwargs):
+    invalidate_author_card(instance.pk)
+
+
+# --------------------------------------
+# DROP CACHED AUTH SNAPSHOTS ON CHANGE
+# --------------------------------------
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def refresh_auth_user(sender, instance, **kwargs):
+    invalidate_auth_user(instance.pk)
+
+
+# --------------------------------------
+# KEEP SEARCH TOKENS IN SYNC
+# --------------------------------------
+@receiver(post_save, sender=User)
+def reindex_user(sender, instance, update_fields=None, **kwargs):
+    # e.g. last_login updates on every login leave the tokens alone
+    if update_fields is not None and not SEARCH_FIELDS.intersection(update_fields):
+        return
+    index_users([instance])
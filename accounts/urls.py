@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import AuthView, UserProfileView
+from .views import AuthView, UserProfileView, UserSearchView
 
 urlpatterns = [
     path('auth/', AuthView.as_view(), name='auth'),
     path("user/profile/", UserProfileView.as_view(), name="user-profile"),
+    path("users/search/", UserSearchView.as_view(), name="user-search"),
 ]
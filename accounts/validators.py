@@ -3,6 +3,30 @@ from typing import Optional, Literal
 from typing_extensions import Annotated
 import re
 
+def validate_nigerian_phone(v):
+    """
+    Nigerian numbers in international form: +234 followed by 10 digits.
+    Raises ValueError otherwise. Also used by the import_users command.
+    """
+    if not v.startswith("+234"):
+        raise ValueError("Phone number must start with +234")
+
+    digits_only = v[1:]  # remove +
+
+    if not digits_only.isdigit():
+        raise ValueError("Phone number must contain only digits after +")
+
+    if len(digits_only) != 13:
+        raise ValueError("Phone number must be exactly 13 digits excluding '+'")
+
+    return v
+
+
+class UserSearchQuery(BaseModel):
+    q: Annotated[str, Field(min_length=1, max_length=100)]
+    limit: int = Field(20, ge=1, le=50)
+
+
 class AuthData(BaseModel):
     action: Literal['register', 'login', 'refresh']
 
@@ -19,18 +43,7 @@ class AuthData(BaseModel):
         if v is None:
             return v
 
-        if not v.startswith("+234"):
-            raise ValueError("Phone number must start with +234")
-
-        digits_only = v[1:]  # remove +
-
-        if not digits_only.isdigit():
-            raise ValueError("Phone number must contain only digits after +")
-
-        if len(digits_only) != 13:
-            raise ValueError("Phone number must be exactly 13 digits excluding '+'")
-
-        return v
+        return validate_nigerian_phone(v)
 
     # ✅ Action-based validation
     @classmethod
@@ -1,15 +1,22 @@
-import os
 import random
 import string
-import requests
 from django.contrib.auth import get_user_model
 from django.utils.decorators import method_decorator
 from django_ratelimit.decorators import ratelimit
 from rest_framework import generics, status
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
-from .serializers import AuthSerializer, UserProfileSerializer
-from .validators import AuthData
+from .denylist import token_denylist
+from .search import search_users
+from .serializers import (
+    USER_SEARCH_FIELDS,
+    AuthSerializer,
+    UserProfileSerializer,
+    UserSearchResultSerializer,
+)
+from .validators import AuthData, UserSearchQuery
+from core.services.turnstile_service import TurnstileError, get_turnstile_service
 from core.utils.api_response import api_response
 from core.utils.validators import validate_with_pydantic
 
@@ -42,8 +49,7 @@ class AuthView(generics.GenericAPIView):
     # Registration logic
     # -----------------------
     def _register(self, data):
-        # 1️⃣ Get Turnstile secret from environment
-        turnstile_secret = os.getenv("CLOUDFLARE_SECRET_KEY")
+        # 1️⃣ Get Turnstile token from the request
         token = data.get("turnstileToken")
 
         if not token:
@@ -55,18 +61,10 @@ class AuthView(generics.GenericAPIView):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 2️⃣ Verify Turnstile token
+        # 2️⃣ Verify Turnstile token (pooled client, results cached per token)
         try:
-            resp = requests.post(
-                "https://challenges.cloudflare.com/turnstile/v0/siteverify",
-                data={
-                    "secret": turnstile_secret,
-                    "response": token
-                },
-                timeout=5
-            )
-            result = resp.json()
-        except requests.RequestException as e:
+            result = get_turnstile_service().verify(token, self.request.META.get("REMOTE_ADDR"))
+        except TurnstileError as e:
             return api_response(
                 success=False,
                 message="Turnstile verification failed",
@@ -132,6 +130,8 @@ class AuthView(generics.GenericAPIView):
                 status_code=status.HTTP_401_UNAUTHORIZED,
             )
 
+        # Also re-encodes the stored hash when it no longer matches the hasher
+        # policy (PASSWORD_HASH_* settings)
         if not user.check_password(data['password']):
             return api_response(
                 success=False,
@@ -175,10 +175,25 @@ class AuthView(generics.GenericAPIView):
                 status_code=status.HTTP_401_UNAUTHORIZED,
             )
 
+        # Each refresh token works once; the used jti stays denied until it expires
+        if not token_denylist.claim(refresh[jwt_settings.JTI_CLAIM], refresh["exp"]):
+            return api_response(
+                success=False,
+                message="Refresh token has already been used",
+                data=None,
+                errors={"detail": "Refresh token has already been used"},
+                status_code=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        # Rotate: same claims, new jti and lifetime
+        refresh.set_jti()
+        refresh.set_exp()
+        refresh.set_iat()
+
         return api_response(
             success=True,
             message="Access token refreshed successfully",
-            data={"access": str(refresh.access_token)},
+            data={"access": str(refresh.access_token), "refresh": str(refresh)},
             errors=None,
             status_code=status.HTTP_200_OK,
         )
@@ -188,8 +203,8 @@ class UserProfileView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_object(self):
-        # Return the currently authenticated user
-        return self.request.user
+        # request.user is a slim cached snapshot; the profile needs every field
+        return User.objects.get(pk=self.request.user.pk)
 
     def retrieve(self, request, *args, **kwargs):
         serializer = self.get_serializer(self.get_object())
@@ -197,3 +212,21 @@ class UserProfileView(generics.RetrieveAPIView):
             data=serializer.data,
             message="User profile fetched successfully"
         )
+
+
+class UserSearchView(generics.GenericAPIView):
+    """Staff lookup by name, username, email or phone prefix."""
+    serializer_class = UserSearchResultSerializer
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        query = validate_with_pydantic(UserSearchQuery, request.query_params.dict())
+        users = (
+            search_users(query.q)
+            .only(*USER_SEARCH_FIELDS)
+            .order_by("first_name", "last_name", "pk")[: query.limit]
+        )
+        return api_response(
+            data=self.get_serializer(users, many=True).data,
+            message="Users fetched successfully",
+        )
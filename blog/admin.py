@@ -21,8 +21,11 @@ class BlogPostAdmin(admin.ModelAdmin):
     readonly_fields = (
         "created_by",
         "views_count",
+        "unique_viewers",
         "likes_count",
         "published_at",
+        "read_time",
+        "word_count",
     )
 
     fieldsets = (
@@ -45,13 +48,15 @@ class BlogPostAdmin(admin.ModelAdmin):
             "fields": (
                 "is_published",
                 "published_at",
-                "read_time",  # ✅ allow admin to set read_time
+                "read_time",  # ✅ derived from the content on save
+                "word_count",
             )
         }),
         ("System", {
             "fields": (
                 "created_by",
                 "views_count",
+                "unique_viewers",
                 "likes_count",
             )
         }),
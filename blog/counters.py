@@ -0,0 +1,212 @@
+import random
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from .feed import bump_feed_counters, sync_feed_entries
+from .models import (
+    BlogComment,
+    BlogLike,
+    BlogLikeCounterShard,
+    BlogPost,
+    BlogViewDaily,
+    BlogViewer,
+)
+from .rollups import last_rolled_up_day, start_of_day
+
+# Counters that feed into BlogPost.popularity_score
+POPULARITY_COUNTERS = ("likes_count", "comments_count")
+
+
+def bump_post_counters(post_ids, **deltas):
+    """
+    Apply counter deltas to one or more posts in a single UPDATE, e.g.
+    ``bump_post_counters([post.pk], comments_count=1)``.
+
+    ``popularity_score`` is kept equal to ``likes_count + comments_count``
+    by moving it by the same amount as those counters.
+    """
+    if isinstance(post_ids, str):
+        post_ids = [post_ids]
+
+    popularity_delta = sum(deltas.get(name, 0) for name in POPULARITY_COUNTERS)
+    if popularity_delta:
+        deltas["popularity_score"] = popularity_delta
+
+    updates = {name: F(name) + delta for name, delta in deltas.items() if delta}
+    if not updates:
+        return 0
+
+    # The list reads counters from the feed projection, keep it in step
+    bump_feed_counters(post_ids, deltas)
+    return BlogPost.objects.filter(pk__in=post_ids).update(**updates)
+
+
+# ────────────────────────────────────────────────
+# SHARDED LIKE COUNTERS
+# ────────────────────────────────────────────────
+def add_like_delta(post_id, delta):
+    """
+    Record a like (+1) or unlike (-1) on a random shard of the post, so
+    concurrent likes update different rows instead of queueing on the
+    BlogPost row. Shards are summed on read and folded back periodically.
+    With BLOG_LIKE_COUNTER_SHARDS = 0 the post is updated directly.
+    """
+    if not settings.BLOG_LIKE_COUNTER_SHARDS:
+        bump_post_counters(post_id, likes_count=delta)
+        return
+
+    shard = random.randrange(settings.BLOG_LIKE_COUNTER_SHARDS)
+    shards = BlogLikeCounterShard.objects.filter(post_id=post_id, shard=shard)
+
+    if shards.update(delta=F("delta") + delta):
+        return
+    try:
+        with transaction.atomic():
+            BlogLikeCounterShard.objects.create(post_id=post_id, shard=shard, delta=delta)
+    except IntegrityError:
+        # Another request created the shard first
+        shards.update(delta=F("delta") + delta)
+
+
+def with_pending_likes(queryset):
+    """
+    Annotate ``pending_likes``, the not-yet-folded shard total of each post.
+    Without shards there is nothing pending and the queryset is unchanged.
+    """
+    if not settings.BLOG_LIKE_COUNTER_SHARDS:
+        return queryset
+
+    pending = (
+        BlogLikeCounterShard.objects.filter(post=OuterRef("pk"))
+        .order_by()
+        .values("post")
+        .annotate(total=Sum("delta"))
+        .values("total")
+    )
+    return queryset.annotate(pending_likes=Coalesce(Subquery(pending), Value(0)))
+
+
+def live_likes_count(post_id):
+    """
+    Current like count of one post: folded likes plus pending shards.
+    """
+    if not settings.BLOG_LIKE_COUNTER_SHARDS:
+        return BlogPost.objects.values_list("likes_count", flat=True).get(pk=post_id)
+
+    post = with_pending_likes(BlogPost.objects.filter(pk=post_id)).values(
+        "likes_count", "pending_likes"
+    ).get()
+    return post["likes_count"] + post["pending_likes"]
+
+
+def fold_like_shards():
+    """
+    Move pending shard deltas into ``BlogPost.likes_count`` (and with it
+    ``popularity_score``). Shards are decremented by what was read rather
+    than reset, so likes landing during the fold are kept. Returns the
+    number of posts updated.
+    """
+    with transaction.atomic():
+        shards = list(
+            BlogLikeCounterShard.objects.exclude(delta=0).values_list("pk", "post_id", "delta")
+        )
+
+        per_post = {}
+        per_delta = {}
+        for pk, post_id, delta in shards:
+            per_post[post_id] = per_post.get(post_id, 0) + delta
+            per_delta.setdefault(delta, []).append(pk)
+
+        per_total = {}
+        for post_id, total in per_post.items():
+            if total:
+                per_total.setdefault(total, []).append(post_id)
+        for total, post_ids in per_total.items():
+            bump_post_counters(post_ids, likes_count=total)
+
+        for delta, pks in per_delta.items():
+            BlogLikeCounterShard.objects.filter(pk__in=pks).update(delta=F("delta") - delta)
+
+    return len(per_post)
+
+
+# ────────────────────────────────────────────────
+# RECONCILIATION
+# ────────────────────────────────────────────────
+RECONCILED_COUNTERS = ("likes_count", "comments_count", "views_count", "popularity_score")
+
+
+def _grouped(queryset, aggregate):
+    return dict(
+        queryset.order_by().values("post_id").annotate(total=aggregate).values_list("post_id", "total")
+    )
+
+
+def expected_counters(post_ids):
+    """
+    Recompute the denormalized counters of ``post_ids`` from their source
+    tables with one grouped query per source.
+
+    likes_count excludes likes still pending on shards, since the shards
+    will add them on the next fold. views_count uses the daily rollups
+    for days whose raw rows may have been purged, plus the raw rows from
+    the last rolled-up day onwards.
+    """
+    likes = _grouped(BlogLike.objects.filter(post_id__in=post_ids), Count("id"))
+    pending = _grouped(BlogLikeCounterShard.objects.filter(post_id__in=post_ids), Sum("delta"))
+    comments = _grouped(BlogComment.objects.filter(post_id__in=post_ids), Count("id"))
+
+    raw_views = BlogViewer.objects.filter(post_id__in=post_ids)
+    rolled_views = {}
+    last_day = last_rolled_up_day()
+    if last_day:
+        raw_views = raw_views.filter(viewed_at__gte=start_of_day(last_day))
+        rolled_views = _grouped(
+            BlogViewDaily.objects.filter(post_id__in=post_ids, date__lt=last_day), Sum("views")
+        )
+    raw_views = _grouped(raw_views, Count("id"))
+
+    expected = {}
+    for post_id in post_ids:
+        likes_count = likes.get(post_id, 0) - (pending.get(post_id) or 0)
+        comments_count = comments.get(post_id, 0)
+        expected[post_id] = {
+            "likes_count": likes_count,
+            "comments_count": comments_count,
+            "views_count": rolled_views.get(post_id, 0) + raw_views.get(post_id, 0),
+            "popularity_score": likes_count + comments_count,
+        }
+    return expected
+
+
+def reconcile_post_counters(post_ids, dry_run=False):
+    """
+    Compare stored counters with ``expected_counters`` and write only the
+    posts that drifted, in one ``bulk_update``. Returns a list of
+    ``(post_id, counter, stored, expected)`` for every drifted value.
+    """
+    with transaction.atomic():
+        expected = expected_counters(post_ids)
+        posts = BlogPost.objects.filter(pk__in=post_ids).only("pk", *RECONCILED_COUNTERS)
+
+        drift = []
+        changed = []
+        for post in posts:
+            fixed = False
+            for name, value in expected[post.pk].items():
+                stored = getattr(post, name)
+                if stored != value:
+                    drift.append((post.pk, name, stored, value))
+                    setattr(post, name, max(value, 0))
+                    fixed = True
+            if fixed:
+                changed.append(post)
+
+        if changed and not dry_run:
+            BlogPost.objects.bulk_update(changed, RECONCILED_COUNTERS)
+            sync_feed_entries([post.pk for post in changed])
+
+    return drift
@@ -0,0 +1,55 @@
+from django.db.models import F
+
+from .models import BlogFeedEntry, BlogPost
+
+# Columns copied verbatim from BlogPost
+FEED_FIELDS = (
+    "title",
+    "slug",
+    "author_name",
+    "cover_image",
+    "author_image",
+    "published_at",
+    "read_time",
+    "views_count",
+    "likes_count",
+    "popularity_score",
+)
+
+# Counters bump_post_counters moves on both tables
+FEED_COUNTERS = ("views_count", "likes_count", "popularity_score")
+
+
+def sync_feed_entries(post_ids):
+    """
+    Copy the current rows of ``post_ids`` into the feed: published posts
+    are upserted, the rest are removed. Values are read back from the
+    database, so counters bumped since an instance was loaded are kept.
+    """
+    rows = BlogPost.objects.filter(pk__in=post_ids, is_published=True).values(
+        "id", "excerpt", "auto_excerpt", *FEED_FIELDS
+    )
+    entries = [
+        BlogFeedEntry(
+            post_id=row["id"],
+            excerpt=row["excerpt"] or row["auto_excerpt"],
+            **{field: row[field] for field in FEED_FIELDS},
+        )
+        for row in rows
+    ]
+
+    BlogFeedEntry.objects.filter(post_id__in=post_ids).exclude(
+        post_id__in=[entry.post_id for entry in entries]
+    ).delete()
+    BlogFeedEntry.objects.bulk_create(
+        entries,
+        update_conflicts=True,
+        unique_fields=["post"],
+        update_fields=["excerpt", *FEED_FIELDS],
+    )
+
+
+def bump_feed_counters(post_ids, deltas):
+    updates = {name: F(name) + deltas[name] for name in FEED_COUNTERS if deltas.get(name)}
+    if updates:
+        BlogFeedEntry.objects.filter(post_id__in=post_ids).update(**updates)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from blog.counters import fold_like_shards
+
+
+class Command(BaseCommand):
+    help = "Fold sharded blog like counters back into BlogPost.likes_count"
+
+    def handle(self, *args, **options):
+        folded = fold_like_shards()
+        self.stdout.write(self.style.SUCCESS(f"Folded like counters of {folded} posts"))
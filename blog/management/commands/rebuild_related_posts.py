@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.related import rebuild_related_posts
+
+
+class Command(BaseCommand):
+    help = "Recompute the related posts of every published blog post"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=settings.BLOG_RELATED_POSTS,
+            help="Related posts stored per post",
+        )
+
+    def handle(self, *args, **options):
+        processed = rebuild_related_posts(options["limit"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt related posts for {processed} posts"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from blog.trending import rebuild_trending
+
+
+class Command(BaseCommand):
+    help = "Recompute trending blog scores from views, likes and comments"
+
+    def handle(self, *args, **options):
+        kept = rebuild_trending()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt trending scores for {kept} posts"))
@@ -0,0 +1,71 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.counters import RECONCILED_COUNTERS, fold_like_shards, reconcile_post_counters
+from blog.models import BlogPost
+
+
+class Command(BaseCommand):
+    help = "Recompute denormalized blog post counters and fix the ones that drifted"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Posts recomputed per transaction",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches, to let other writers in",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+
+        # Fold first so likes_count holds as much as possible
+        if not dry_run:
+            self.stdout.write(f"Folded like shards of {fold_like_shards()} posts")
+
+        stats = {name: {"posts": 0, "total": 0, "max": 0} for name in RECONCILED_COUNTERS}
+        scanned = 0
+        fixed = set()
+
+        last_pk = None
+        while True:
+            posts = BlogPost.objects.order_by("pk")
+            if last_pk is not None:
+                posts = posts.filter(pk__gt=last_pk)
+            post_ids = list(posts.values_list("pk", flat=True)[: options["batch_size"]])
+            if not post_ids:
+                break
+            last_pk = post_ids[-1]
+            scanned += len(post_ids)
+
+            for post_id, name, stored, expected in reconcile_post_counters(post_ids, dry_run):
+                diff = abs(expected - stored)
+                counter = stats[name]
+                counter["posts"] += 1
+                counter["total"] += diff
+                counter["max"] = max(counter["max"], diff)
+                fixed.add(post_id)
+
+            if options["pause"]:
+                time.sleep(options["pause"])
+
+        for name, counter in stats.items():
+            self.stdout.write(
+                f"{name}: {counter['posts']} posts drifted, "
+                f"total drift {counter['total']}, max {counter['max']}"
+            )
+
+        verb = "would fix" if dry_run else "fixed"
+        self.stdout.write(self.style.SUCCESS(f"Scanned {scanned} posts, {verb} {len(fixed)}"))
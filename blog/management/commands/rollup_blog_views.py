@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.rollups import purge_raw_views, rollup_views
+
+
+class Command(BaseCommand):
+    help = "Roll raw blog viewers up into daily totals and purge old raw rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.BLOG_VIEWER_RETENTION_DAYS,
+            help="Keep raw viewer rows for this many days",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Raw rows deleted per DELETE statement",
+        )
+        parser.add_argument(
+            "--skip-purge",
+            action="store_true",
+            help="Only roll up, keep every raw row",
+        )
+
+    def handle(self, *args, **options):
+        written = rollup_views()
+        self.stdout.write(f"Rolled up {written} post-day rows")
+
+        if options["skip_purge"]:
+            return
+
+        deleted = purge_raw_views(options["retention_days"], options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} raw viewer rows"))
@@ -0,0 +1,91 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:07
+
+import hashlib
+import math
+import zlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of the blog.hll encoding (2**12 one-byte registers, blake2b,
+# zlib-compressed), so this migration keeps working if hll.py changes
+PRECISION = 12
+REGISTER_COUNT = 1 << PRECISION
+VALUE_BITS = 64 - PRECISION
+ALPHA = 0.7213 / (1 + 1.079 / REGISTER_COUNT)
+
+
+def add_to_registers(registers, value):
+    x = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+    index = x >> VALUE_BITS
+    rank = VALUE_BITS - (x & ((1 << VALUE_BITS) - 1)).bit_length() + 1
+    if rank > registers[index]:
+        registers[index] = rank
+
+
+def count_registers(registers):
+    estimate = ALPHA * REGISTER_COUNT * REGISTER_COUNT / sum(2.0 ** -r for r in registers)
+    if estimate <= 2.5 * REGISTER_COUNT:
+        zeros = registers.count(0)
+        if zeros:
+            estimate = REGISTER_COUNT * math.log(REGISTER_COUNT / zeros)
+    return int(round(estimate))
+
+
+def seed_view_sketches(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    BlogViewer = apps.get_model("blog", "BlogViewer")
+    BlogViewSketch = apps.get_model("blog", "BlogViewSketch")
+
+    sketches = {}
+    viewers = BlogViewer.objects.values_list("post_id", "user_id", "session_id", "viewed_at")
+    for post_id, user_id, session_id, viewed_at in viewers.iterator():
+        key = f"u:{user_id}" if user_id else f"s:{session_id}"
+        for day in (None, viewed_at.date()):
+            add_to_registers(sketches.setdefault((post_id, day), bytearray(REGISTER_COUNT)), key)
+
+    BlogViewSketch.objects.bulk_create(
+        [
+            BlogViewSketch(
+                post_id=post_id,
+                day=day,
+                registers=zlib.compress(bytes(registers)),
+                estimate=count_registers(registers),
+            )
+            for (post_id, day), registers in sketches.items()
+        ],
+        batch_size=500,
+    )
+
+    for (post_id, day), registers in sketches.items():
+        if day is None:
+            BlogPost.objects.filter(pk=post_id).update(unique_viewers=count_registers(registers))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_alter_blogcomment_options_alter_bloglike_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='unique_viewers',
+            field=models.PositiveIntegerField(default=0, help_text='Estimated distinct viewers, from the all-time view sketch'),
+        ),
+        migrations.CreateModel(
+            name='BlogViewSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(blank=True, help_text='Day covered by this sketch; empty for the all-time sketch', null=True)),
+                ('registers', models.BinaryField()),
+                ('estimate', models.PositiveIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_sketches', to='blog.blogpost')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('post', 'day'), name='unique_blog_view_sketch_day'), models.UniqueConstraint(condition=models.Q(('day__isnull', True)), fields=('post',), name='unique_blog_view_sketch_all_time')],
+            },
+        ),
+        migrations.RunPython(seed_view_sketches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_blogpost_unique_viewers_blogviewsketch'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogViewDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('unique_users', models.PositiveIntegerField(default=0)),
+                ('unique_sessions', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Blog Daily Views',
+                'verbose_name_plural': 'Blog Daily Views',
+                'ordering': ['date'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='blogviewer',
+            index=models.Index(fields=['viewed_at'], name='blog_viewer_viewed_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='blogviewdaily',
+            name='post',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='blog.blogpost'),
+        ),
+        migrations.AddConstraint(
+            model_name='blogviewdaily',
+            constraint=models.UniqueConstraint(fields=('post', 'date'), name='unique_blog_view_daily'),
+        ),
+    ]
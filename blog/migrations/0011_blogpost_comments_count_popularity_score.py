@@ -0,0 +1,47 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:09
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    BlogComment = apps.get_model("blog", "BlogComment")
+
+    comments = (
+        BlogComment.objects.filter(post=OuterRef("pk"))
+        .order_by()
+        .values("post")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    BlogPost.objects.update(comments_count=Coalesce(Subquery(comments), Value(0)))
+    BlogPost.objects.update(popularity_score=F("likes_count") + F("comments_count"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_blogviewdaily_blogviewer_viewed_at_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='popularity_score',
+            field=models.PositiveIntegerField(default=0, help_text='likes_count + comments_count, used by sort=popular'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['is_published', 'popularity_score', 'published_at'], name='blog_post_popular_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_paths(apps, schema_editor):
+    BlogComment = apps.get_model("blog", "BlogComment")
+
+    comments = list(BlogComment.objects.order_by("id").values("id", "parent_id"))
+    by_id = {comment["id"]: comment for comment in comments}
+
+    def resolve(comment):
+        if "path" in comment:
+            return comment
+        segment = f"{comment['id']:010d}"
+        parent = by_id.get(comment["parent_id"])
+        if parent is None:
+            comment.update(path=segment, depth=0, root_id=comment["id"])
+        else:
+            resolve(parent)
+            comment.update(
+                path=f"{parent['path']}/{segment}",
+                depth=parent["depth"] + 1,
+                root_id=parent["root_id"],
+            )
+        return comment
+
+    rows = []
+    for comment in comments:
+        resolve(comment)
+        rows.append(
+            BlogComment(
+                id=comment["id"],
+                path=comment["path"],
+                depth=comment["depth"],
+                root_id=comment["root_id"],
+            )
+        )
+    BlogComment.objects.bulk_update(rows, ["path", "depth", "root_id"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_blogpost_comments_count_popularity_score'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogcomment',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogcomment',
+            name='path',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='blogcomment',
+            name='root',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='thread_comments', to='blog.blogcomment'),
+        ),
+        migrations.AlterField(
+            model_name='blogcomment',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='child_comments', to='blog.blogcomment'),
+        ),
+        migrations.AddIndex(
+            model_name='blogcomment',
+            index=models.Index(fields=['post', 'depth', 'id'], name='blog_comment_top_level_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogcomment',
+            index=models.Index(fields=['root', 'path'], name='blog_comment_thread_idx'),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_blogcomment_threading'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogLikeCounterShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.PositiveSmallIntegerField()),
+                ('delta', models.IntegerField(default=0, help_text='Likes minus unlikes not yet folded into BlogPost.likes_count')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='like_shards', to='blog.blogpost')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('post', 'shard'), name='unique_blog_like_counter_shard')],
+            },
+        ),
+    ]
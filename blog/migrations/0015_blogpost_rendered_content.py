@@ -0,0 +1,58 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:18
+
+from django.db import migrations, models
+
+from blog.rendering import content_hash, derive_content
+
+
+def render_existing_posts(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+
+    posts = []
+    for post in BlogPost.objects.only("pk", "content").iterator():
+        for field, value in derive_content(post.content).items():
+            setattr(post, field, value)
+        post.content_hash = content_hash(post.content)
+        posts.append(post)
+
+    BlogPost.objects.bulk_update(
+        posts,
+        ["content_html", "auto_excerpt", "word_count", "read_time", "content_hash"],
+        batch_size=200,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_blogrelatedpost'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='auto_excerpt',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='blogpost',
+            name='read_time',
+            field=models.PositiveIntegerField(default=5, help_text='Estimated read time in minutes, derived from the word count'),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FEED_FIELDS = (
+    "title",
+    "slug",
+    "author_name",
+    "cover_image",
+    "author_image",
+    "published_at",
+    "read_time",
+    "views_count",
+    "likes_count",
+    "popularity_score",
+)
+
+
+def fill_feed(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    BlogFeedEntry = apps.get_model("blog", "BlogFeedEntry")
+
+    rows = BlogPost.objects.filter(is_published=True).values(
+        "id", "excerpt", "auto_excerpt", *FEED_FIELDS
+    )
+    BlogFeedEntry.objects.bulk_create(
+        [
+            BlogFeedEntry(
+                post_id=row["id"],
+                excerpt=row["excerpt"] or row["auto_excerpt"],
+                **{field: row[field] for field in FEED_FIELDS},
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_blogpost_rendered_content'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogFeedEntry',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='feed_entry', serialize=False, to='blog.blogpost')),
+                ('title', models.CharField(max_length=200)),
+                ('slug', models.SlugField()),
+                ('excerpt', models.TextField(blank=True)),
+                ('author_name', models.CharField(max_length=100)),
+                ('cover_image', models.ImageField(upload_to='blog/covers/')),
+                ('author_image', models.ImageField(blank=True, null=True, upload_to='blog/authors/')),
+                ('published_at', models.DateTimeField(blank=True, null=True)),
+                ('read_time', models.PositiveIntegerField(default=5)),
+                ('views_count', models.PositiveIntegerField(default=0)),
+                ('likes_count', models.PositiveIntegerField(default=0)),
+                ('popularity_score', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Blog Feed Entry',
+                'verbose_name_plural': 'Blog Feed Entries',
+                'indexes': [models.Index(fields=['published_at', 'post'], name='blog_feed_newest_idx'), models.Index(fields=['popularity_score', 'published_at', 'post'], name='blog_feed_popular_idx')],
+            },
+        ),
+        migrations.RunPython(fill_feed, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:55
+
+import django.db.models.deletion
+import hashlib
+
+from django.db import migrations, models
+
+
+def seed_seen_viewers(apps, schema_editor):
+    # Same hash as blog.tracking.viewer_hash, frozen here
+    BlogViewer = apps.get_model("blog", "BlogViewer")
+    BlogSeenViewer = apps.get_model("blog", "BlogSeenViewer")
+
+    seen = set()
+    viewers = BlogViewer.objects.values_list("post_id", "user_id", "session_id")
+    for post_id, user_id, session_id in viewers.iterator():
+        key = f"u:{user_id}" if user_id else f"s:{session_id}"
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        seen.add((post_id, int.from_bytes(digest, "big", signed=True)))
+
+    BlogSeenViewer.objects.bulk_create(
+        [BlogSeenViewer(post_id=post_id, viewer=viewer) for post_id, viewer in seen],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0016_blogfeedentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogSeenViewer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('viewer', models.BigIntegerField(help_text='64-bit hash of the viewer key')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='blog.blogpost')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('post', 'viewer'), name='unique_blog_seen_viewer')],
+            },
+        ),
+        migrations.RunPython(seed_seen_viewers, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,13 @@
 import cuid
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.utils.text import slugify
 from django.core.files.base import ContentFile
 from io import BytesIO
 from PIL import Image
 
+from .rendering import content_hash, derive_content
+
 
 def generate_cuid():
     return cuid.cuid()
@@ -58,12 +60,35 @@ class BlogPost(models.Model):
 
     views_count = models.PositiveIntegerField(default=0)
     likes_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
+    popularity_score = models.PositiveIntegerField(
+        default=0,
+        help_text="likes_count + comments_count, used by sort=popular"
+    )
+    unique_viewers = models.PositiveIntegerField(
+        default=0,
+        help_text="Estimated distinct viewers, from the all-time view sketch"
+    )
 
     read_time = models.PositiveIntegerField(
         default=5,
-        help_text="Minimum estimated read time for this blog in minutes"
+        help_text="Estimated read time in minutes, derived from the word count"
     )
 
+    # Derived from content on save (see rendering.py)
+    content_html = models.TextField(blank=True, editable=False)
+    auto_excerpt = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["is_published", "popularity_score", "published_at"],
+                name="blog_post_popular_idx",
+            ),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
@@ -75,8 +100,25 @@ class BlogPost(models.Model):
                 max_height=800
             )
 
+        # Re-render only when the content actually changed
+        digest = content_hash(self.content)
+        if digest != self.content_hash:
+            derived = derive_content(self.content)
+            for field, value in derived.items():
+                setattr(self, field, value)
+            self.content_hash = digest
+
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *derived, "content_hash"}
+
         super().save(*args, **kwargs)
 
+    @property
+    def summary(self):
+        """The hand-written excerpt, or the derived one when it is blank."""
+        return self.excerpt or self.auto_excerpt
+
     def __str__(self):
         return self.title
 
@@ -84,6 +126,9 @@ class BlogPost(models.Model):
 # ────────────────────────────────────────────────
 # BLOG COMMENT
 # ────────────────────────────────────────────────
+COMMENT_PATH_SEGMENT = 10
+MAX_COMMENT_DEPTH = 20
+
 class BlogComment(models.Model):
     post = models.ForeignKey(
         BlogPost,
@@ -98,19 +143,57 @@ class BlogComment(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
-    # Optional: for nested/threaded comments in the future
+    # Threaded comments: parent is the comment replied to, root the
+    # top-level comment of the thread and path the materialized path of
+    # zero-padded ids, so a thread sorts depth-first by path.
     parent = models.ForeignKey(
         "self",
         null=True,
         blank=True,
-        on_delete=models.SET_NULL,
+        on_delete=models.CASCADE,
         related_name="child_comments"          # ← changed: no clash
     )
+    root = models.ForeignKey(
+        "self",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.CASCADE,
+        related_name="thread_comments"
+    )
+    path = models.CharField(max_length=255, blank=True, editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Blog Comment"
         verbose_name_plural = "Blog Comments"
+        indexes = [
+            models.Index(fields=["post", "depth", "id"], name="blog_comment_top_level_idx"),
+            models.Index(fields=["root", "path"], name="blog_comment_thread_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The path needs the pk, so a new comment takes two writes; keep them
+        # together so no reader sees it without its place in the thread
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            if not self.path:
+                segment = f"{self.pk:0{COMMENT_PATH_SEGMENT}d}"
+                if self.parent_id:
+                    parent = self.parent
+                    self.path = f"{parent.path}/{segment}"
+                    self.depth = parent.depth + 1
+                    self.root_id = parent.root_id
+                else:
+                    self.path = segment
+                    self.depth = 0
+                    self.root_id = self.pk
+
+                BlogComment.objects.filter(pk=self.pk).update(
+                    path=self.path, depth=self.depth, root_id=self.root_id
+                )
 
     def __str__(self):
         return f"Comment by {self.user} on {self.post}"
@@ -162,6 +245,33 @@ class BlogLike(models.Model):
         ordering = ["-created_at"]
 
 
+# ────────────────────────────────────────────────
+# BLOG LIKE COUNTER SHARD (see counters.py)
+# ────────────────────────────────────────────────
+class BlogLikeCounterShard(models.Model):
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        related_name="like_shards"
+    )
+    shard = models.PositiveSmallIntegerField()
+    delta = models.IntegerField(
+        default=0,
+        help_text="Likes minus unlikes not yet folded into BlogPost.likes_count"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "shard"],
+                name="unique_blog_like_counter_shard",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Like shard {self.shard} of {self.post_id}: {self.delta:+d}"
+
+
 # ────────────────────────────────────────────────
 # BLOG VIEWER
 # ────────────────────────────────────────────────
@@ -190,8 +300,176 @@ class BlogViewer(models.Model):
     class Meta:
         unique_together = ("post", "user", "session_id")
         ordering = ["-viewed_at"]
+        indexes = [
+            models.Index(fields=["viewed_at"], name="blog_viewer_viewed_at_idx"),
+        ]
 
     def __str__(self):
         if self.user:
             return f"{self.user} viewed {self.post}"
-        return f"Anonymous ({self.session_id}) viewed {self.post}"
\ No newline at end of file
+        return f"Anonymous ({self.session_id}) viewed {self.post}"
+
+
+# ────────────────────────────────────────────────
+# BLOG SEEN VIEWER (dedupe record, see tracking.py)
+# ────────────────────────────────────────────────
+class BlogSeenViewer(models.Model):
+    """
+    Compact record that a viewer has been counted for a post. Unlike the
+    ``BlogViewer`` row it survives ``purge_raw_views``, so a returning
+    viewer is never counted twice.
+    """
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+    viewer = models.BigIntegerField(help_text="64-bit hash of the viewer key")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "viewer"],
+                name="unique_blog_seen_viewer",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Viewer {self.viewer} seen on {self.post_id}"
+
+
+# ────────────────────────────────────────────────
+# BLOG VIEW DAILY ROLLUP (see rollups.py)
+# ────────────────────────────────────────────────
+class BlogViewDaily(models.Model):
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        related_name="daily_views"
+    )
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    unique_users = models.PositiveIntegerField(default=0)
+    unique_sessions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "date"],
+                name="unique_blog_view_daily",
+            ),
+        ]
+        verbose_name = "Blog Daily Views"
+        verbose_name_plural = "Blog Daily Views"
+
+    def __str__(self):
+        return f"{self.views} views of {self.post_id} on {self.date}"
+
+
+# ────────────────────────────────────────────────
+# BLOG VIEW SKETCH (HyperLogLog, see hll.py)
+# ────────────────────────────────────────────────
+class BlogViewSketch(models.Model):
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        related_name="view_sketches"
+    )
+    day = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Day covered by this sketch; empty for the all-time sketch"
+    )
+    registers = models.BinaryField()
+    estimate = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "day"],
+                name="unique_blog_view_sketch_day",
+            ),
+            models.UniqueConstraint(
+                fields=["post"],
+                condition=models.Q(day__isnull=True),
+                name="unique_blog_view_sketch_all_time",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Viewer sketch for {self.post_id} ({self.day or 'all time'})"
+
+
+# ────────────────────────────────────────────────
+# BLOG RELATED POST (TF-IDF neighbours, see related.py)
+# ────────────────────────────────────────────────
+class BlogRelatedPost(models.Model):
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        related_name="related_links"
+    )
+    related = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField(help_text="Cosine similarity of the two posts")
+
+    class Meta:
+        ordering = ["post", "rank"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "rank"],
+                name="unique_blog_related_post_rank",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.related_id} is #{self.rank} related to {self.post_id}"
+
+
+# ────────────────────────────────────────────────
+# BLOG FEED ENTRY (list projection, see feed.py)
+# ────────────────────────────────────────────────
+class BlogFeedEntry(models.Model):
+    """
+    Narrow copy of a published post holding only what the list endpoint
+    shows and sorts by. Unpublished posts have no entry.
+    """
+    post = models.OneToOneField(
+        BlogPost,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="feed_entry"
+    )
+    title = models.CharField(max_length=200)
+    slug = models.SlugField()
+    excerpt = models.TextField(blank=True)
+    author_name = models.CharField(max_length=100)
+
+    # Same files as the post; only the stored names are copied
+    cover_image = models.ImageField(upload_to="blog/covers/")
+    author_image = models.ImageField(upload_to="blog/authors/", null=True, blank=True)
+
+    published_at = models.DateTimeField(null=True, blank=True)
+    read_time = models.PositiveIntegerField(default=5)
+    views_count = models.PositiveIntegerField(default=0)
+    likes_count = models.PositiveIntegerField(default=0)
+    popularity_score = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["published_at", "post"], name="blog_feed_newest_idx"),
+            models.Index(
+                fields=["popularity_score", "published_at", "post"],
+                name="blog_feed_popular_idx",
+            ),
+        ]
+        verbose_name = "Blog Feed Entry"
+        verbose_name_plural = "Blog Feed Entries"
+
+    def __str__(self):
+        return self.title
@@ -0,0 +1,280 @@
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.html import strip_tags
+
+from core.cache import shared_cache
+
+from .models import BlogPost, BlogRelatedPost
+
+RELATED_VERSION_KEY = "blog:related-version"
+
+TOKEN_RE = re.compile(r"[^\W_]{2,}")
+
+# Title words say more about a post than body words
+FIELD_WEIGHTS = (("title", 3), ("excerpt", 2), ("content", 1))
+
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be been but by can do for from has have he her his how i if
+    in into is it its me my no not of on or our she so than that the their them
+    then there these they this to too up us was we were what when where which who
+    why will with you your
+    """.split()
+)
+
+
+def tokenize(text):
+    return [
+        token
+        for token in TOKEN_RE.findall(strip_tags(text or "").lower())
+        if token not in STOP_WORDS
+    ]
+
+
+# ────────────────────────────────────────────────
+# SPARSE TF-IDF
+# ────────────────────────────────────────────────
+def count_terms(fields):
+    """Weighted term counts of ``(title, excerpt, content)``."""
+    terms = Counter()
+    for (_, weight), text in zip(FIELD_WEIGHTS, fields):
+        for token in tokenize(text):
+            terms[token] += weight
+    return terms
+
+
+def weigh(terms, idf, default_idf):
+    """
+    Unit-length TF-IDF vector of ``terms``. Term frequency is sublinear
+    (1 + log tf) so long posts do not drown short ones; terms missing
+    from ``idf`` get ``default_idf``.
+    """
+    vector = {term: (1 + math.log(tf)) * idf.get(term, default_idf) for term, tf in terms.items()}
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return {}
+    return {term: weight / norm for term, weight in vector.items()}
+
+
+class RelatedModel:
+    """
+    IDF table, vectors of published posts and the inverted index
+    ``{term: {post_id: weight}}`` over them. A single post can be
+    re-vectorized and swapped in without touching the others.
+    """
+
+    def __init__(self, posts):
+        # posts: rows of (id, title, excerpt, content)
+        counts = {post_id: count_terms(fields) for post_id, *fields in posts}
+        document_frequency = Counter()
+        for terms in counts.values():
+            document_frequency.update(terms.keys())
+
+        total = len(counts)
+        self.idf = {
+            term: math.log((1 + total) / (1 + frequency)) + 1
+            for term, frequency in document_frequency.items()
+        }
+        # A term seen in no other post weighs as if it were in one
+        self.default_idf = math.log((1 + total) / 2) + 1
+
+        self.vectors = {}
+        self.index = {}
+        for post_id, terms in counts.items():
+            self.put(post_id, weigh(terms, self.idf, self.default_idf))
+
+    def put(self, post_id, vector):
+        self.remove(post_id)
+        self.vectors[post_id] = vector
+        for term, weight in vector.items():
+            self.index.setdefault(term, {})[post_id] = weight
+
+    def remove(self, post_id):
+        for term in self.vectors.pop(post_id, {}):
+            self.index[term].pop(post_id, None)
+
+    def update(self, post_id, fields):
+        """Re-vectorize one post with the current IDF table."""
+        self.put(post_id, weigh(count_terms(fields), self.idf, self.default_idf))
+
+    def similarities(self, vector):
+        """
+        Cosine similarity of ``vector`` with every post sharing a term with
+        it. Only the postings of its own terms are visited.
+        """
+        scores = {}
+        for term, weight in vector.items():
+            for post_id, other in self.index.get(term, {}).items():
+                scores[post_id] = scores.get(post_id, 0.0) + weight * other
+        return scores
+
+
+def nearest(post_id, scores, limit):
+    candidates = ((score, other) for other, score in scores.items() if other != post_id and score > 0)
+    return [(other, score) for score, other in heapq.nlargest(limit, candidates)]
+
+
+# ────────────────────────────────────────────────
+# PER-WORKER MODEL, VERSIONED THROUGH THE CACHE
+# ────────────────────────────────────────────────
+_lock = threading.RLock()
+_model = None
+_model_version = None
+
+
+def _corpus():
+    return (
+        BlogPost.objects.filter(is_published=True)
+        .order_by()
+        .values_list("id", "title", "excerpt", "content")
+    )
+
+
+def current_version():
+    version = shared_cache.get(RELATED_VERSION_KEY)
+    if version is None:
+        shared_cache.add(RELATED_VERSION_KEY, 1, None)
+        version = shared_cache.get(RELATED_VERSION_KEY, 1)
+    return version
+
+
+def _bump_version():
+    try:
+        shared_cache.incr(RELATED_VERSION_KEY)
+    except ValueError:
+        shared_cache.set(RELATED_VERSION_KEY, 2, None)
+
+
+def get_model():
+    """
+    This worker's model, built from the whole corpus on first use and
+    after each ``rebuild_related_posts``. Saves in between only update
+    the saved post, so vectors of posts edited in other workers and IDF
+    drift stay stale until the next rebuild (run it periodically).
+    """
+    global _model, _model_version
+
+    version = current_version()
+    with _lock:
+        if _model is None or _model_version != version:
+            _model = RelatedModel(_corpus())
+            _model_version = version
+        return _model
+
+
+# ────────────────────────────────────────────────
+# NEIGHBOUR TABLE
+# ────────────────────────────────────────────────
+def _store(neighbours):
+    """Replace the stored neighbours of every post in ``neighbours``."""
+    with transaction.atomic():
+        BlogRelatedPost.objects.filter(post_id__in=neighbours).delete()
+        BlogRelatedPost.objects.bulk_create(
+            [
+                BlogRelatedPost(post_id=post_id, related_id=other, rank=rank, score=score)
+                for post_id, ranked in neighbours.items()
+                for rank, (other, score) in enumerate(ranked, start=1)
+            ],
+            batch_size=500,
+        )
+
+
+def rebuild_related_posts(limit=None):
+    """
+    Recompute the neighbours of every published post from a fresh model,
+    and make every worker reload theirs. Returns the number of posts
+    processed.
+    """
+    global _model, _model_version
+
+    limit = limit or settings.BLOG_RELATED_POSTS
+    model = RelatedModel(_corpus())
+
+    neighbours = {
+        post_id: nearest(post_id, model.similarities(vector), limit)
+        for post_id, vector in model.vectors.items()
+    }
+    with transaction.atomic():
+        BlogRelatedPost.objects.exclude(post_id__in=neighbours).delete()
+        _store(neighbours)
+
+    _bump_version()
+    with _lock:
+        _model, _model_version = model, current_version()
+    return len(neighbours)
+
+
+def refresh_related_posts(post_id, limit=None):
+    """
+    Update the neighbour table after ``post_id`` was saved, re-vectorizing
+    only that post against the cached model.
+
+    Recomputed are the post itself, posts that currently list it, and
+    posts it is now similar enough to enter the top ``limit`` of.
+    """
+    limit = limit or settings.BLOG_RELATED_POSTS
+    row = _corpus().filter(pk=post_id).first()
+
+    with _lock:
+        model = get_model()
+        if row is None:
+            # Unpublished: it must not be anyone's neighbour
+            model.remove(post_id)
+        else:
+            model.update(post_id, row[1:])
+
+        affected = set(
+            BlogRelatedPost.objects.filter(related_id=post_id).values_list("post_id", flat=True)
+        )
+
+        if row is None:
+            BlogRelatedPost.objects.filter(post_id=post_id).delete()
+        else:
+            affected.add(post_id)
+            scores = model.similarities(model.vectors[post_id])
+
+            lowest = {}
+            sizes = Counter()
+            for other, score in BlogRelatedPost.objects.filter(post_id__in=scores).values_list(
+                "post_id", "score"
+            ):
+                lowest[other] = min(score, lowest.get(other, score))
+                sizes[other] += 1
+            for other, score in scores.items():
+                if other != post_id and score > 0 and (sizes[other] < limit or score > lowest[other]):
+                    affected.add(other)
+
+        return _recompute(affected, model, limit)
+
+
+def recompute_related_posts(post_ids, limit=None):
+    """Recompute the neighbours of ``post_ids`` only."""
+    with _lock:
+        return _recompute(post_ids, get_model(), limit or settings.BLOG_RELATED_POSTS)
+
+
+def _recompute(post_ids, model, limit):
+    # Take spares: the worker's model may still hold posts that were
+    # unpublished or deleted elsewhere, and those are dropped below
+    ranked = {
+        post_id: nearest(post_id, model.similarities(model.vectors[post_id]), limit * 2)
+        for post_id in post_ids
+        if post_id in model.vectors
+    }
+    candidates = {other for neighbours in ranked.values() for other, _ in neighbours}
+    live = set(
+        BlogPost.objects.filter(pk__in=candidates, is_published=True).values_list("pk", flat=True)
+    )
+
+    neighbours = {
+        post_id: [(other, score) for other, score in ranked_posts if other in live][:limit]
+        for post_id, ranked_posts in ranked.items()
+    }
+    _store(neighbours)
+    return len(neighbours)
@@ -0,0 +1,150 @@
+import hashlib
+import math
+import re
+from html import escape, unescape
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from django.utils.html import linebreaks
+from django.utils.text import Truncator
+
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 280
+
+ALLOWED_TAGS = frozenset(
+    """
+    a abbr b blockquote br code em figcaption figure h2 h3 h4 h5 h6 hr i img li
+    ol p pre s small strong sub sup table tbody td th thead tr u ul
+    """.split()
+)
+VOID_TAGS = frozenset({"br", "hr", "img"})
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title"},
+    "img": {"src", "alt", "title", "width", "height"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan"},
+}
+URL_ATTRIBUTES = frozenset({"href", "src"})
+SAFE_URL_SCHEMES = frozenset({"", "http", "https", "mailto"})
+
+# Tags dropped together with everything inside them
+DROPPED_TAGS = frozenset({"script", "style", "iframe", "object", "embed", "template", "noscript"})
+
+TAG_RE = re.compile(r"</?[a-zA-Z][\w-]*(\s[^<>]*)?/?>")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+class _Sanitizer(HTMLParser):
+    """
+    Allowlist HTML sanitizer: unknown tags are unwrapped (their text is
+    kept), dropped tags lose their content, and attributes are limited to
+    ``ALLOWED_ATTRIBUTES`` with safe URL schemes only.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.open_tags = []
+        self.dropping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROPPED_TAGS:
+            self.dropping += 1
+            return
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+
+        allowed = ALLOWED_ATTRIBUTES.get(tag, ())
+        rendered = []
+        for name, value in attrs:
+            if name not in allowed or value is None:
+                continue
+            if name in URL_ATTRIBUTES and not _is_safe_url(value):
+                continue
+            rendered.append(f' {name}="{escape(value)}"')
+        if tag == "a":
+            rendered.append(' rel="nofollow noopener"')
+
+        self.parts.append(f"<{tag}{''.join(rendered)}>")
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self.open_tags and self.open_tags[-1] == tag:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_TAGS:
+            self.dropping = max(self.dropping - 1, 0)
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        # Close anything left open inside this tag as well
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.parts.append(f"</{open_tag}>")
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self.dropping:
+            self.parts.append(escape(data, quote=False))
+
+    def close(self):
+        super().close()
+        while self.open_tags:
+            self.parts.append(f"</{self.open_tags.pop()}>")
+        return "".join(self.parts)
+
+
+def _is_safe_url(value):
+    scheme = urlsplit(WHITESPACE_RE.sub("", value)).scheme.lower()
+    return scheme in SAFE_URL_SCHEMES
+
+
+def sanitize_html(html):
+    sanitizer = _Sanitizer()
+    sanitizer.feed(html)
+    return sanitizer.close()
+
+
+# ────────────────────────────────────────────────
+# DERIVED CONTENT (stored on BlogPost.save)
+# ────────────────────────────────────────────────
+def content_hash(content):
+    return hashlib.sha256((content or "").encode()).hexdigest()
+
+
+def render_content(content):
+    """
+    Safe HTML for ``content``. Plain text becomes paragraphs and line
+    breaks; HTML is passed through the allowlist sanitizer.
+    """
+    content = content or ""
+    if TAG_RE.search(content):
+        return sanitize_html(content)
+    return linebreaks(content, autoescape=True)
+
+
+def plain_text(html):
+    text = re.sub(r"<[^>]+>", " ", html)
+    return WHITESPACE_RE.sub(" ", unescape(text)).strip()
+
+
+def derive_content(content):
+    """
+    Everything ``BlogPost`` stores about its content: ``content_html``,
+    ``auto_excerpt``, ``word_count`` and ``read_time`` (whole minutes at
+    ``WORDS_PER_MINUTE``, at least one).
+    """
+    html = render_content(content)
+    text = plain_text(html)
+    word_count = len(text.split())
+
+    return {
+        "content_html": html,
+        "auto_excerpt": Truncator(text).chars(EXCERPT_LENGTH),
+        "word_count": word_count,
+        "read_time": max(1, math.ceil(word_count / WORDS_PER_MINUTE)),
+    }
@@ -0,0 +1,79 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import BlogViewDaily, BlogViewer
+
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def last_rolled_up_day():
+    return BlogViewDaily.objects.aggregate(last=Max("date"))["last"]
+
+
+def rollup_views():
+    """
+    Aggregate raw ``BlogViewer`` rows into ``BlogViewDaily``.
+
+    Only days from the last rolled-up day onwards are scanned. That day is
+    aggregated again because it may have been partial the previous run;
+    every earlier day is final. Returns the number of rows written.
+    """
+    viewers = BlogViewer.objects.order_by()
+
+    last_day = last_rolled_up_day()
+    if last_day:
+        viewers = viewers.filter(viewed_at__gte=start_of_day(last_day))
+
+    totals = (
+        viewers.annotate(date=TruncDate("viewed_at"))
+        .values("post_id", "date")
+        .annotate(
+            views=Count("id"),
+            unique_users=Count("user", distinct=True),
+            unique_sessions=Count("session_id", distinct=True),
+        )
+    )
+
+    rows = [BlogViewDaily(**row) for row in totals]
+    BlogViewDaily.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["post", "date"],
+        update_fields=["views", "unique_users", "unique_sessions"],
+    )
+    return len(rows)
+
+
+def purge_raw_views(retention_days, chunk_size=1000):
+    """
+    Delete raw viewer rows older than ``retention_days``, in chunks of
+    ``chunk_size`` so no single DELETE holds the write lock for long.
+
+    Rows are never deleted before they are rolled up: days from the last
+    rolled-up day onwards are always kept. Returning viewers are still
+    recognised afterwards through ``BlogSeenViewer``. Returns the number
+    deleted.
+    """
+    cutoff = timezone.now() - timedelta(days=retention_days)
+
+    last_day = last_rolled_up_day()
+    if last_day is None:
+        return 0
+    cutoff = min(cutoff, start_of_day(last_day))
+
+    deleted = 0
+    while True:
+        ids = list(
+            BlogViewer.objects.filter(viewed_at__lt=cutoff)
+            .order_by()
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not ids:
+            return deleted
+        deleted += BlogViewer.objects.filter(pk__in=ids).delete()[0]
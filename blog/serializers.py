@@ -1,6 +1,15 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from .models import BlogPost, BlogComment, BlogReply
+from django.db import models
+from accounts.cards import load_author_cards
+from .models import (
+    BlogPost,
+    BlogComment,
+    BlogFeedEntry,
+    BlogRelatedPost,
+    BlogReply,
+    BlogViewDaily,
+)
 
 User = get_user_model()
 
@@ -12,6 +21,9 @@ class BlogPostListSerializer(serializers.ModelSerializer):
     cover_image_url = serializers.SerializerMethodField()
     author_image_url = serializers.SerializerMethodField()
     read_time = serializers.IntegerField(read_only=True)
+    excerpt = serializers.CharField(source="summary", read_only=True)
+    likes_count = serializers.SerializerMethodField()
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = BlogPost
@@ -27,6 +39,7 @@ class BlogPostListSerializer(serializers.ModelSerializer):
             "likes_count",
             "cover_image_url",
             "read_time",
+            "is_liked",
         ]
 
     def get_cover_image_url(self, obj):
@@ -41,6 +54,61 @@ class BlogPostListSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.author_image.url)
         return None
 
+    def get_likes_count(self, obj):
+        # Folded likes plus pending shard deltas (with_pending_likes)
+        return obj.likes_count + getattr(obj, "pending_likes", 0)
+
+    def get_is_liked(self, obj):
+        # Annotated for the whole page by the view (with_liked_flag)
+        return getattr(obj, "is_liked", False)
+
+
+# --------------------------
+# LIST BLOG POSTS (feed projection)
+# --------------------------
+class BlogFeedEntrySerializer(BlogPostListSerializer):
+    """
+    Same output as BlogPostListSerializer, read from BlogFeedEntry, whose
+    excerpt already falls back to the derived one.
+    """
+    id = serializers.CharField(source="post_id", read_only=True)
+    excerpt = serializers.CharField(read_only=True)
+
+    class Meta(BlogPostListSerializer.Meta):
+        model = BlogFeedEntry
+
+
+# --------------------------
+# RELATED POSTS
+# --------------------------
+class BlogRelatedPostSerializer(serializers.ModelSerializer):
+    id = serializers.CharField(source="related.id")
+    title = serializers.CharField(source="related.title")
+    slug = serializers.CharField(source="related.slug")
+    excerpt = serializers.CharField(source="related.summary")
+    read_time = serializers.IntegerField(source="related.read_time")
+    published_at = serializers.DateTimeField(source="related.published_at")
+    cover_image_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BlogRelatedPost
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "excerpt",
+            "read_time",
+            "published_at",
+            "cover_image_url",
+            "score",
+        ]
+
+    def get_cover_image_url(self, obj):
+        request = self.context.get("request")
+        if obj.related.cover_image and request:
+            return request.build_absolute_uri(obj.related.cover_image.url)
+        return None
+
 
 # --------------------------
 # BLOG DETAIL
@@ -49,8 +117,10 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
     cover_image_url = serializers.SerializerMethodField()
     author_image_url = serializers.SerializerMethodField()
     read_time = serializers.IntegerField(read_only=True)
-    comments_count = serializers.IntegerField(source="comments.count", read_only=True)
+    excerpt = serializers.CharField(source="summary", read_only=True)
+    likes_count = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()  # <-- NEW FIELD
+    related = serializers.SerializerMethodField()
 
     class Meta:
         model = BlogPost
@@ -60,15 +130,19 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
             "slug",
             "excerpt",
             "content",
+            "content_html",
+            "word_count",
             "author_name",
             "author_image_url",
             "published_at",
             "views_count",
             "likes_count",
+            "unique_viewers",
             "read_time",
             "comments_count",
             "cover_image_url",
             "is_liked",  # <-- include this in API
+            "related",
         ]
 
     def get_cover_image_url(self, obj):
@@ -83,21 +157,74 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.author_image.url)
         return None
 
+    def get_likes_count(self, obj):
+        # Folded likes plus pending shard deltas (with_pending_likes)
+        return obj.likes_count + getattr(obj, "pending_likes", 0)
+
     def get_is_liked(self, obj):
-        user = self.context["request"].user
-        if user.is_authenticated:
-            return obj.likes.filter(user=user).exists()
-        return False
+        # Annotated by the view (with_liked_flag), no extra query
+        return getattr(obj, "is_liked", False)
+
+    def get_related(self, obj):
+        # One lookup on the (post, rank) index, joined to the related posts
+        links = (
+            BlogRelatedPost.objects.filter(post=obj, related__is_published=True)
+            .select_related("related")
+            .only(
+                "score",
+                "related__id",
+                "related__title",
+                "related__slug",
+                "related__excerpt",
+                "related__auto_excerpt",
+                "related__read_time",
+                "related__published_at",
+                "related__cover_image",
+            )
+            .order_by("rank")
+        )
+        return BlogRelatedPostSerializer(links, many=True, context=self.context).data
+
+# --------------------------
+# AUTHOR CARDS (see accounts/cards.py)
+# --------------------------
+class AuthorCardListSerializer(serializers.ListSerializer):
+    """
+    Loads the author card of every row on the page at once, so
+    serializing N comments costs at most one user query instead of N.
+    """
+
+    def to_representation(self, data):
+        rows = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        self.child.author_cards = load_author_cards({row.user_id for row in rows})
+        return super().to_representation(rows)
+
+
+class AuthorCardMixin:
+    author_cards = None
+
+    def get_author_card(self, obj):
+        if self.author_cards is None or obj.user_id not in self.author_cards:
+            return load_author_cards([obj.user_id])[obj.user_id]
+        return self.author_cards[obj.user_id]
+
+    def get_user_name(self, obj):
+        return self.get_author_card(obj)["name"]
+
+    def get_user_img_url(self, obj):
+        return self.get_author_card(obj)["avatar_url"]
+
 
 # --------------------------
 # COMMENT SERIALIZER
 # --------------------------
-class BlogCommentSerializer(serializers.ModelSerializer):
+class BlogCommentSerializer(AuthorCardMixin, serializers.ModelSerializer):
     user_name = serializers.SerializerMethodField()
     user_img_url = serializers.SerializerMethodField()
 
     class Meta:
         model = BlogComment
+        list_serializer_class = AuthorCardListSerializer
         fields = [
             "id",
             "post",                     # optional — can be read_only
@@ -111,23 +238,6 @@ class BlogCommentSerializer(serializers.ModelSerializer):
             "id", "created_at", "user_name", "user_img_url", "post"
         ]
 
-    def get_user_name(self, obj):
-        if not obj.user:
-            return "Deleted User"
-    # Use username as fallback, optionally phone
-        return obj.user.username or obj.user.phone or "Anonymous"
-
-
-    def get_user_img_url(self, obj):
-        request = self.context.get("request")
-        if obj.user and obj.user.profile_picture:
-            url = obj.user.profile_picture
-            return request.build_absolute_uri(url) if request else url
-
-    # Nice fallback using ui-avatars.com (no extra storage needed)
-        name = obj.user.get_full_name() or obj.user.username or "User"
-        return f"https://ui-avatars.com/api/?name={name.replace(' ', '+')}&background=random"
-
     def create(self, validated_data):
         # user is always set from request
         validated_data["user"] = self.context["request"].user
@@ -135,15 +245,33 @@ class BlogCommentSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+# ────────────────────────────────────────────────
+# THREADED COMMENT SERIALIZER
+# ────────────────────────────────────────────────
+class BlogCommentThreadSerializer(BlogCommentSerializer):
+    class Meta(BlogCommentSerializer.Meta):
+        fields = [
+            "id",
+            "content",
+            "user_name",
+            "user_img_url",
+            "created_at",
+            "parent",
+            "depth",
+        ]
+        read_only_fields = fields
+
+
 # ────────────────────────────────────────────────
 # REPLY SERIALIZER
 # ────────────────────────────────────────────────
-class BlogReplySerializer(serializers.ModelSerializer):
+class BlogReplySerializer(AuthorCardMixin, serializers.ModelSerializer):
     user_name = serializers.SerializerMethodField()
     user_img_url = serializers.SerializerMethodField()
 
     class Meta:
         model = BlogReply
+        list_serializer_class = AuthorCardListSerializer
         fields = [
             "id",
             "comment",                  # read_only in most cases
@@ -156,20 +284,16 @@ class BlogReplySerializer(serializers.ModelSerializer):
             "id", "created_at", "user_name", "user_img_url", "comment"
         ]
 
-    def get_user_name(self, obj):
-        if not obj.user:
-            return "Deleted User"
-    # Use username as fallback, optionally phone
-        return obj.user.username or obj.user.phone or "Anonymous"
-
-    def get_user_img_url(self, obj):
-        request = self.context.get("request")
-        if obj.user and obj.user.profile_picture:
-            url = obj.user.profile_picture
-            return request.build_absolute_uri(url) if request else url
-
-    # Nice fallback using ui-avatars.com (no extra storage needed)
-        name = obj.user.get_full_name() or obj.user.username or "User"
-        return f"https://ui-avatars.com/api/?name={name.replace(' ', '+')}&background=random"
-
 
+# ────────────────────────────────────────────────
+# DAILY VIEW ANALYTICS
+# ────────────────────────────────────────────────
+class BlogViewDailySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BlogViewDaily
+        fields = [
+            "date",
+            "views",
+            "unique_users",
+            "unique_sessions",
+        ]
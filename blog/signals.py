@@ -1,6 +1,14 @@
-from django.db.models.signals import post_delete, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
-from .models import BlogPost
+from core.sitemaps import publish_blog_changes
+from core.snapshots import BLOG_SNAPSHOTS, export_on_commit
+from .counters import add_like_delta, bump_post_counters
+from .feed import sync_feed_entries
+from .models import BlogPost, BlogComment, BlogLike, BlogRelatedPost
+from .related import recompute_related_posts, refresh_related_posts
+from .suggest import invalidate_suggestions
+from .trending import COMMENT_WEIGHT, LIKE_WEIGHT, record_engagement
 
 
 # --------------------------------------
@@ -15,17 +23,30 @@ def delete_blog_images(sender, instance, **kwargs):
         instance.author_image.delete(save=False)
 
 
+# --------------------------------------
+# REMEMBER THE ROW BEING REPLACED
+# --------------------------------------
+@receiver(pre_save, sender=BlogPost)
+def remember_previous_post(sender, instance, **kwargs):
+    # Read by the receivers below; None for a new post
+    instance._previous = BlogPost.objects.filter(pk=instance.pk).first() if instance.pk else None
+
+
+def changed(instance, fields):
+    """True when the save creates the post or changes any of ``fields``."""
+    previous = getattr(instance, "_previous", None)
+    if previous is None:
+        return True
+    return any(getattr(previous, field) != getattr(instance, field) for field in fields)
+
+
 # --------------------------------------
 # DELETE OLD IMAGES ON UPDATE
 # --------------------------------------
 @receiver(pre_save, sender=BlogPost)
 def replace_blog_images(sender, instance, **kwargs):
-    if not instance.pk:
-        return
-
-    try:
-        old = BlogPost.objects.get(pk=instance.pk)
-    except BlogPost.DoesNotExist:
+    old = getattr(instance, "_previous", None)
+    if old is None:
         return
 
     # 🔄 Cover image replaced
@@ -35,3 +56,124 @@ def replace_blog_images(sender, instance, **kwargs):
     # 🔄 Author image replaced
     if old.author_image and old.author_image != instance.author_image:
         old.author_image.delete(save=False)
+
+
+# --------------------------------------
+# KEEP COMMENT / LIKE COUNTERS IN SYNC
+# --------------------------------------
+def deleting_post(origin):
+    """
+    True when a delete cascades from a post (``post.delete()`` or a post
+    queryset ``.delete()``), so its counters need no updating.
+    """
+    return isinstance(origin, BlogPost) or getattr(origin, "model", None) is BlogPost
+
+
+@receiver(post_save, sender=BlogComment)
+def count_new_comment(sender, instance, created, **kwargs):
+    if created:
+        bump_post_counters(instance.post_id, comments_count=1)
+        transaction.on_commit(lambda: record_engagement({instance.post_id: COMMENT_WEIGHT}))
+
+
+@receiver(post_delete, sender=BlogComment)
+def count_deleted_comment(sender, instance, origin=None, **kwargs):
+    # The post itself is going away, nothing to keep in sync
+    if deleting_post(origin):
+        return
+    bump_post_counters(instance.post_id, comments_count=-1)
+
+
+# Likes go to sharded counters (if enabled); fold_like_counters moves them to the post
+@receiver(post_save, sender=BlogLike)
+def count_new_like(sender, instance, created, **kwargs):
+    if created:
+        add_like_delta(instance.post_id, 1)
+        transaction.on_commit(lambda: record_engagement({instance.post_id: LIKE_WEIGHT}))
+
+
+@receiver(post_delete, sender=BlogLike)
+def count_deleted_like(sender, instance, origin=None, **kwargs):
+    if deleting_post(origin):
+        return
+    add_like_delta(instance.post_id, -1)
+
+
+# --------------------------------------
+# KEEP RELATED POSTS IN SYNC
+# --------------------------------------
+RELATED_POST_FIELDS = {"title", "excerpt", "content", "is_published"}
+
+
+@receiver(post_save, sender=BlogPost)
+def refresh_related_on_save(sender, instance, update_fields=None, **kwargs):
+    # Counter and admin saves that leave the text alone cost nothing here
+    if update_fields is not None and not RELATED_POST_FIELDS.intersection(update_fields):
+        return
+    if not changed(instance, RELATED_POST_FIELDS):
+        return
+    transaction.on_commit(lambda: refresh_related_posts(instance.pk))
+
+
+@receiver(pre_delete, sender=BlogPost)
+def refresh_related_on_delete(sender, instance, **kwargs):
+    # The cascade removes the links, so collect who listed this post first
+    linked = list(
+        BlogRelatedPost.objects.filter(related=instance).values_list("post_id", flat=True)
+    )
+    if linked:
+        transaction.on_commit(lambda: recompute_related_posts(linked))
+
+
+# --------------------------------------
+# REBUILD TITLE SUGGESTIONS
+# --------------------------------------
+SUGGEST_FIELDS = {"title", "slug", "is_published"}
+
+
+@receiver(post_save, sender=BlogPost)
+def invalidate_suggestions_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not SUGGEST_FIELDS.intersection(update_fields):
+        return
+    transaction.on_commit(invalidate_suggestions)
+
+
+@receiver(post_delete, sender=BlogPost)
+def invalidate_suggestions_on_delete(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_suggestions)
+
+
+# --------------------------------------
+# KEEP THE LIST FEED IN SYNC
+# --------------------------------------
+# Deleted posts leave the feed through the cascade on BlogFeedEntry.post
+@receiver(post_save, sender=BlogPost)
+def sync_feed_on_save(sender, instance, **kwargs):
+    sync_feed_entries([instance.pk])
+
+
+# --------------------------------------
+# REGENERATE SITEMAP SHARD + FEEDS
+# --------------------------------------
+@receiver(post_save, sender=BlogPost)
+def publish_post_sitemap(sender, instance, **kwargs):
+    # A post moved to another month must also leave its old month's shard
+    previous = getattr(instance, "_previous", None)
+    dates = [instance.published_at]
+    if previous is not None:
+        dates.append(previous.published_at)
+    transaction.on_commit(lambda: publish_blog_changes(*dates))
+
+
+@receiver(post_delete, sender=BlogPost)
+def unpublish_post_sitemap(sender, instance, **kwargs):
+    transaction.on_commit(lambda: publish_blog_changes(instance.published_at))
+
+
+# --------------------------------------
+# RE-EXPORT BLOG LIST SNAPSHOTS
+# --------------------------------------
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def export_blog_snapshots(sender, instance, **kwargs):
+    export_on_commit(*BLOG_SNAPSHOTS)
@@ -0,0 +1,161 @@
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+
+from django.conf import settings
+
+from core.cache import shared_cache
+
+from .models import BlogPost
+
+SUGGEST_VERSION_KEY = "blog:suggest-version"
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def normalize(text):
+    """Lowercase word tokens with accents folded (``Café`` -> ``cafe``)."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    folded = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return TOKEN_RE.findall(folded.lower())
+
+
+class PrefixIndex:
+    """
+    Sorted array of distinct title tokens with a parallel array of the
+    posts containing each token, searched with ``bisect``. Posts are kept
+    in rank order (most popular first), so the first matches found are
+    the best ones.
+    """
+
+    def __init__(self, posts):
+        # posts: (id, title, slug) in rank order
+        self.posts = []
+        postings = {}
+        for position, (post_id, title, slug) in enumerate(posts):
+            tokens = normalize(title)
+            self.posts.append({"id": post_id, "title": title, "slug": slug, "tokens": tokens})
+            for token in set(tokens):
+                postings.setdefault(token, []).append(position)
+
+        self.tokens = sorted(postings)
+        self.postings = [postings[token] for token in self.tokens]
+
+    def _positions(self, prefix):
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\uffff", lo=start)
+        positions = set()
+        for postings in self.postings[start:end]:
+            positions.update(postings)
+        return positions
+
+    def search(self, query, limit):
+        """
+        Posts whose title has a token starting with every query token.
+        Titles that start with the query come first, then by rank.
+        """
+        terms = normalize(query)
+        if not terms:
+            return []
+
+        # Seek on the longest term, it has the fewest matches
+        candidates = self._positions(max(terms, key=len))
+        matches = []
+        for position in candidates:
+            tokens = self.posts[position]["tokens"]
+            if all(any(token.startswith(term) for token in tokens) for term in terms):
+                matches.append(position)
+
+        *complete, partial = terms
+
+        def rank(position):
+            # The last term may still be being typed, so it only has to
+            # start the matching title word
+            tokens = self.posts[position]["tokens"]
+            starts_with_query = (
+                len(tokens) >= len(terms)
+                and tokens[: len(complete)] == complete
+                and tokens[len(complete)].startswith(partial)
+            )
+            return (not starts_with_query, position)
+
+        matches.sort(key=rank)
+        return [
+            {key: self.posts[position][key] for key in ("id", "title", "slug")}
+            for position in matches[:limit]
+        ]
+
+
+# ────────────────────────────────────────────────
+# PER-WORKER INDEX, VERSIONED THROUGH THE CACHE
+# ────────────────────────────────────────────────
+_lock = threading.Lock()
+_index = None
+_index_version = None
+# time.monotonic() of the last look at the shared version
+_index_checked_at = None
+
+
+def current_version():
+    version = shared_cache.get(SUGGEST_VERSION_KEY)
+    if version is None:
+        shared_cache.add(SUGGEST_VERSION_KEY, 1, None)
+        version = shared_cache.get(SUGGEST_VERSION_KEY, 1)
+    return version
+
+
+def invalidate_suggestions():
+    """
+    Rebuild this worker's index on its next suggest request, and every
+    other worker's once it next checks the version.
+    """
+    global _index_checked_at
+
+    try:
+        shared_cache.incr(SUGGEST_VERSION_KEY)
+    except ValueError:
+        shared_cache.set(SUGGEST_VERSION_KEY, 1, None)
+        # A worker may still hold version 1; make sure it rebuilds too
+        shared_cache.incr(SUGGEST_VERSION_KEY)
+    _index_checked_at = None
+
+
+def get_index():
+    """
+    This worker's index, built on first use and rebuilt once the version
+    in the shared cache moved on, whichever process saved the post. The
+    version is read at most every BLOG_SUGGEST_VERSION_CHECK_SECONDS, so
+    keystrokes in between cost no cache or database round trip.
+    """
+    global _index, _index_version, _index_checked_at
+
+    now = time.monotonic()
+    if (
+        _index is not None
+        and _index_checked_at is not None
+        and now - _index_checked_at < settings.BLOG_SUGGEST_VERSION_CHECK_SECONDS
+    ):
+        return _index
+
+    version = current_version()
+    if _index is not None and _index_version == version:
+        _index_checked_at = now
+        return _index
+
+    with _lock:
+        if _index is None or _index_version != version:
+            posts = (
+                BlogPost.objects.filter(is_published=True)
+                .order_by("-popularity_score", "-published_at", "-id")
+                .values_list("id", "title", "slug")
+            )
+            _index = PrefixIndex(posts)
+            _index_version = version
+        _index_checked_at = now
+    return _index
+
+
+def suggest(query, limit):
+    return get_index().search(query, limit)
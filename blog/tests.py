@@ -1,3 +1,48 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .models import BlogPost, BlogViewDaily, BlogViewer
+from .rollups import purge_raw_views
+from .tracking import ViewBuffer
+
+
+@override_settings(BLOG_VIEW_FLUSH_INTERVAL=0)
+class ViewDedupeAfterPurgeTests(TestCase):
+    def setUp(self):
+        self.post = BlogPost.objects.create(
+            title="Preparing for Hajj",
+            content="Pack light.",
+            author_name="Assembly Tour",
+            is_published=True,
+        )
+        self.buffer = ViewBuffer()
+
+    def test_returning_viewer_is_not_counted_again_after_purge(self):
+        self.buffer.record(self.post.pk, session_id="returning")
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views_count, 1)
+
+        # The first view is old enough to purge and already rolled up
+        BlogViewer.objects.update(viewed_at=timezone.now() - timedelta(days=60))
+        BlogViewDaily.objects.create(post=self.post, date=timezone.localdate(), views=1)
+        self.assertEqual(purge_raw_views(retention_days=30), 1)
+
+        self.buffer.record(self.post.pk, session_id="returning")
+        self.assertEqual(self.buffer.flush(), 0)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views_count, 1)
+        self.assertFalse(BlogViewer.objects.exists())
+
+    def test_new_viewer_after_purge_is_counted(self):
+        self.buffer.record(self.post.pk, session_id="first")
+        BlogViewer.objects.update(viewed_at=timezone.now() - timedelta(days=60))
+        BlogViewDaily.objects.create(post=self.post, date=timezone.localdate(), views=1)
+        purge_raw_views(retention_days=30)
+
+        self.buffer.record(self.post.pk, session_id="second")
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views_count, 2)
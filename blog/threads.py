@@ -0,0 +1,95 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.urls import reverse
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import replace_query_param
+
+from .models import BlogComment
+
+
+# ────────────────────────────────────────────────
+# THREAD QUERIES (materialized paths, see BlogComment)
+# ────────────────────────────────────────────────
+def thread_rows(root_ids, max_depth, replies):
+    """
+    Every comment of the given threads down to ``max_depth`` in one
+    query, depth-first within each thread. Each thread is cut to its root
+    plus ``replies`` replies, plus one extra row that flags truncation.
+    """
+    return (
+        BlogComment.objects.filter(root_id__in=root_ids, depth__lte=max_depth)
+        .annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=[F("root_id")],
+                order_by=F("path").asc(),
+            )
+        )
+        .filter(position__lte=replies + 2)
+        .order_by("-root_id", "path")
+    )
+
+
+def descendant_rows(comment, max_depth, after_path=None):
+    """
+    Descendants of ``comment`` down to ``max_depth`` levels below it,
+    depth-first, resuming after ``after_path``. The path range keeps this
+    a seek on the (root, path) index.
+    """
+    lower = f"{comment.path}/"
+    if after_path and after_path > lower:
+        lower = after_path
+
+    return (
+        BlogComment.objects.filter(
+            root_id=comment.root_id,
+            path__gt=lower,
+            path__lt=f"{comment.path}0",
+            depth__lte=comment.depth + max_depth,
+        )
+        .order_by("path")
+    )
+
+
+# ────────────────────────────────────────────────
+# TREE ASSEMBLY + "MORE REPLIES" CURSORS
+# ────────────────────────────────────────────────
+def nest(rows, data):
+    """
+    Nest serialized comments under their parents. ``rows`` must be in
+    depth-first order, and ``data`` holds their serialized dicts in the
+    same order. Comments whose parent is not in ``rows`` stay top-level.
+    """
+    nodes = {}
+    top = []
+    for row, item in zip(rows, data):
+        node = {**item, "replies": []}
+        nodes[row.pk] = node
+
+        parent = nodes.get(row.parent_id)
+        if parent is not None:
+            parent["replies"].append(node)
+        else:
+            top.append(node)
+    return top
+
+
+def encode_replies_cursor(request, comment_id, last_path, depth):
+    token = urlsafe_b64encode(json.dumps({"p": last_path}).encode()).decode()
+    url = request.build_absolute_uri(
+        reverse("blog-comment-thread-replies", kwargs={"comment_id": comment_id})
+    )
+    url = replace_query_param(url, "depth", depth)
+    return replace_query_param(url, "cursor", token)
+
+
+def decode_replies_cursor(token):
+    if not token:
+        return None
+    try:
+        return str(json.loads(urlsafe_b64decode(token.encode()))["p"])
+    except (KeyError, TypeError, ValueError):
+        raise NotFound("Invalid cursor")
@@ -0,0 +1,250 @@
+import atexit
+import hashlib
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .counters import bump_post_counters
+from .hll import HyperLogLog
+from .models import BlogPost, BlogSeenViewer, BlogViewer, BlogViewSketch
+from .trending import VIEW_WEIGHT, record_engagement
+
+logger = logging.getLogger(__name__)
+
+
+def viewer_key(user_id, session_id):
+    """
+    Identity a viewer is counted under in the unique-viewer sketches.
+    """
+    return f"u:{user_id}" if user_id else f"s:{session_id}"
+
+
+def viewer_hash(user_id, session_id):
+    """
+    Signed 64-bit hash of ``viewer_key``, as stored in ``BlogSeenViewer``.
+    """
+    digest = hashlib.blake2b(viewer_key(user_id, session_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def estimate_unique_viewers(post_id, start, end):
+    """
+    Estimate distinct viewers of a post between two days (inclusive) by
+    merging its daily sketches.
+    """
+    merged = HyperLogLog()
+    sketches = BlogViewSketch.objects.filter(
+        post_id=post_id, day__gte=start, day__lte=end
+    ).values_list("registers", flat=True)
+    for registers in sketches:
+        merged.merge(HyperLogLog.from_bytes(registers))
+    return merged.count()
+
+
+# ────────────────────────────────────────────────
+# WRITE-BEHIND VIEW BUFFER
+# ────────────────────────────────────────────────
+class ViewBuffer:
+    """
+    Buffers blog post views in-process and writes them in bulk.
+
+    Views are coalesced per post and per viewer, then flushed with one
+    ``bulk_create`` for the new viewer rows and one grouped UPDATE of
+    ``views_count`` per post. A daemon thread flushes every
+    ``BLOG_VIEW_FLUSH_INTERVAL`` seconds, and whatever is still pending
+    is flushed when the worker exits cleanly.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._flusher = None
+        self._flusher_pid = None
+        self._stopped = threading.Event()
+
+    @property
+    def interval(self):
+        return getattr(settings, "BLOG_VIEW_FLUSH_INTERVAL", 10)
+
+    def record(self, post_id, user_id=None, session_id=None, ip_address=None, user_agent=""):
+        """
+        Queue a view. Authenticated viewers are keyed by user, anonymous
+        viewers by session, matching the ``BlogViewer`` uniqueness rule.
+        """
+        key = (user_id, None if user_id else session_id)
+
+        with self._lock:
+            viewers = self._pending.setdefault(post_id, {})
+            viewers.setdefault(key, (ip_address, user_agent))
+
+        if self.interval <= 0:
+            self.flush()
+        else:
+            self._ensure_flusher()
+
+    def flush(self):
+        """
+        Write every pending view. Returns the number of new viewer rows.
+        On a database error the batch is put back so nothing is dropped.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        try:
+            return self._write(pending)
+        except DatabaseError:
+            self._requeue(pending)
+            raise
+
+    def _write(self, pending):
+        hashes = {
+            key: viewer_hash(*key) for viewers in pending.values() for key in viewers
+        }
+
+        with transaction.atomic():
+            live_posts = set(
+                BlogPost.objects.filter(pk__in=pending, is_published=True)
+                .values_list("pk", flat=True)
+            )
+
+            # Checked against the seen records rather than the raw rows,
+            # which purge_raw_views deletes
+            seen = set(
+                BlogSeenViewer.objects.filter(
+                    post_id__in=live_posts, viewer__in=set(hashes.values())
+                ).values_list("post_id", "viewer")
+            )
+
+            new_viewers = []
+            new_seen = []
+            increments = {}
+            for post_id, viewers in pending.items():
+                if post_id not in live_posts:
+                    continue
+                for (user_id, session_id), (ip_address, user_agent) in viewers.items():
+                    viewer = hashes[(user_id, session_id)]
+                    if (post_id, viewer) in seen:
+                        continue
+                    new_viewers.append(
+                        BlogViewer(
+                            post_id=post_id,
+                            user_id=user_id,
+                            session_id=session_id,
+                            ip_address=ip_address,
+                            user_agent=user_agent,
+                        )
+                    )
+                    new_seen.append(BlogSeenViewer(post_id=post_id, viewer=viewer))
+                    increments[post_id] = increments.get(post_id, 0) + 1
+
+            BlogViewer.objects.bulk_create(new_viewers, batch_size=500)
+            BlogSeenViewer.objects.bulk_create(new_seen, batch_size=500)
+
+            # Posts that gained the same number of viewers share one UPDATE
+            by_delta = {}
+            for post_id, delta in increments.items():
+                by_delta.setdefault(delta, []).append(post_id)
+            for delta, post_ids in by_delta.items():
+                bump_post_counters(post_ids, views_count=delta)
+
+            self._update_sketches(pending, live_posts)
+
+            weights = {post_id: delta * VIEW_WEIGHT for post_id, delta in increments.items()}
+            transaction.on_commit(lambda: record_engagement(weights))
+
+        return len(new_viewers)
+
+    def _update_sketches(self, pending, post_ids):
+        """
+        Fold the flushed viewers into each post's all-time and daily
+        HyperLogLog sketches and refresh ``BlogPost.unique_viewers``.
+        Re-adding a viewer is a no-op, so no dedupe lookup is needed.
+        """
+        today = timezone.localdate()
+        rows = {
+            (row.post_id, row.day): row
+            for row in BlogViewSketch.objects.filter(post_id__in=post_ids).filter(
+                Q(day__isnull=True) | Q(day=today)
+            )
+        }
+
+        new_rows, changed_rows, posts = [], [], []
+        for post_id in post_ids:
+            keys = [viewer_key(user_id, session_id) for user_id, session_id in pending[post_id]]
+
+            for day in (None, today):
+                row = rows.get((post_id, day))
+                sketch = HyperLogLog.from_bytes(row.registers if row else None)
+                for key in keys:
+                    sketch.add(key)
+
+                if row is None:
+                    row = BlogViewSketch(post_id=post_id, day=day)
+                    new_rows.append(row)
+                else:
+                    changed_rows.append(row)
+                row.registers = sketch.to_bytes()
+                row.estimate = sketch.count()
+
+                if day is None:
+                    posts.append(BlogPost(pk=post_id, unique_viewers=row.estimate))
+
+        BlogViewSketch.objects.bulk_create(new_rows)
+        BlogViewSketch.objects.bulk_update(changed_rows, ["registers", "estimate"])
+        BlogPost.objects.bulk_update(posts, ["unique_viewers"])
+
+    def _requeue(self, pending):
+        with self._lock:
+            for post_id, viewers in pending.items():
+                bucket = self._pending.setdefault(post_id, {})
+                for key, meta in viewers.items():
+                    bucket.setdefault(key, meta)
+
+    # -----------------------
+    # Background flusher
+    # -----------------------
+    def _ensure_flusher(self):
+        pid = os.getpid()
+        if self._flusher is not None and self._flusher_pid == pid and self._flusher.is_alive():
+            return
+
+        with self._lock:
+            if self._flusher is not None and self._flusher_pid == pid and self._flusher.is_alive():
+                return
+            self._stopped.clear()
+            self._flusher_pid = pid
+            self._flusher = threading.Thread(
+                target=self._run, name="blog-view-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush buffered blog views")
+            finally:
+                close_old_connections()
+
+    def shutdown(self):
+        """
+        Stop the flusher and write whatever is still buffered.
+        """
+        self._stopped.set()
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to flush buffered blog views on shutdown")
+
+
+view_buffer = ViewBuffer()
+atexit.register(view_buffer.shutdown)
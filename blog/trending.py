@@ -0,0 +1,162 @@
+import math
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Count
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from core.cache import shared_cache
+
+from .models import BlogComment, BlogLike, BlogViewDaily, BlogViewer
+from .rollups import last_rolled_up_day, start_of_day
+
+TRENDING_CACHE_KEY = "blog:trending"
+
+# How much one event of each kind is worth
+VIEW_WEIGHT = 1.0
+LIKE_WEIGHT = 3.0
+COMMENT_WEIGHT = 5.0
+
+# Scores are stored as logs relative to a fixed epoch, so an old score
+# never has to be decayed before a new event is added to it
+TRENDING_EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+
+# Posts tracked beyond the served top K, so a post climbing into the top
+# does not start from zero. Events older than this many half-lives are
+# ignored by the rebuild (they are worth under 0.1% of a new one).
+CAPACITY_FACTOR = 4
+REBUILD_HALF_LIVES = 10
+
+_lock = threading.Lock()
+
+
+def _time_constant():
+    return settings.BLOG_TRENDING_HALF_LIFE_HOURS * 3600 / math.log(2)
+
+
+def _log_weight(weight, at):
+    return math.log(weight) + (at - TRENDING_EPOCH).total_seconds() / _time_constant()
+
+
+def _logaddexp(a, b):
+    if a is None:
+        return b
+    high, low = max(a, b), min(a, b)
+    return high + math.log1p(math.exp(low - high))
+
+
+def _capacity():
+    return settings.BLOG_TRENDING_SIZE * CAPACITY_FACTOR
+
+
+def _trim(scores):
+    if len(scores) <= _capacity():
+        return scores
+    top = sorted(scores.items(), key=lambda item: item[1], reverse=True)[: _capacity()]
+    return dict(top)
+
+
+# ────────────────────────────────────────────────
+# INCREMENTAL UPDATES
+# ────────────────────────────────────────────────
+def record_engagement(weights, at=None):
+    """
+    Add ``{post_id: weight}`` engagement at ``at`` (default now) to the
+    cached scores with one cache read and write. A post that fell out of
+    the tracked set restarts from this event until the next rebuild.
+
+    The lock only covers this process; two workers updating at once can
+    drop one event, which the periodic rebuild_trending puts back.
+    """
+    if not weights:
+        return
+    at = at or timezone.now()
+
+    with _lock:
+        scores = shared_cache.get(TRENDING_CACHE_KEY)
+        if scores is None:
+            # Nothing to add to yet; the first read rebuilds from the database
+            return
+        for post_id, weight in weights.items():
+            if weight > 0:
+                scores[post_id] = _logaddexp(scores.get(post_id), _log_weight(weight, at))
+        shared_cache.set(TRENDING_CACHE_KEY, _trim(scores), None)
+
+
+# ────────────────────────────────────────────────
+# FULL REBUILD
+# ────────────────────────────────────────────────
+def _hourly(queryset, field):
+    return (
+        queryset.order_by()
+        .annotate(hour=TruncHour(field))
+        .values("post_id", "hour")
+        .annotate(total=Count("id"))
+        .values_list("post_id", "hour", "total")
+    )
+
+
+def rebuild_trending():
+    """
+    Recompute every score from views, likes and comments inside the decay
+    window and replace the set in the shared cache, where every worker
+    reads it. Returns the number of posts kept.
+    """
+    now = timezone.now()
+    since = now - timedelta(hours=settings.BLOG_TRENDING_HALF_LIFE_HOURS * REBUILD_HALF_LIVES)
+    published = {"post__is_published": True}
+
+    events = []
+
+    # Rolled-up days count at noon; raw rows are only read where the
+    # rollups may be partial or purged rows never reached them
+    raw_since = since
+    last_day = last_rolled_up_day()
+    if last_day:
+        rolled = BlogViewDaily.objects.filter(
+            date__gte=since.date(), date__lt=last_day, **published
+        ).values_list("post_id", "date", "views")
+        for post_id, day, views in rolled:
+            events.append((post_id, start_of_day(day) + timedelta(hours=12), views * VIEW_WEIGHT))
+        raw_since = max(since, start_of_day(last_day))
+
+    sources = (
+        (BlogViewer.objects.filter(viewed_at__gte=raw_since, **published), "viewed_at", VIEW_WEIGHT),
+        (BlogLike.objects.filter(created_at__gte=since, **published), "created_at", LIKE_WEIGHT),
+        (BlogComment.objects.filter(created_at__gte=since, **published), "created_at", COMMENT_WEIGHT),
+    )
+    for queryset, field, weight in sources:
+        for post_id, hour, total in _hourly(queryset, field):
+            events.append((post_id, hour, total * weight))
+
+    scores = {}
+    for post_id, at, weight in events:
+        if weight > 0:
+            scores[post_id] = _logaddexp(scores.get(post_id), _log_weight(weight, at))
+
+    scores = _trim(scores)
+    with _lock:
+        shared_cache.set(TRENDING_CACHE_KEY, scores, None)
+    return len(scores)
+
+
+# ────────────────────────────────────────────────
+# READS
+# ────────────────────────────────────────────────
+def top_trending(limit=None):
+    """
+    ``[(post_id, score), ...]`` best first, where score is the decayed
+    engagement as of now. Only a cold cache falls back to a rebuild.
+    """
+    limit = limit or settings.BLOG_TRENDING_SIZE
+
+    scores = shared_cache.get(TRENDING_CACHE_KEY)
+    if scores is None:
+        rebuild_trending()
+        scores = shared_cache.get(TRENDING_CACHE_KEY, {})
+
+    offset = (timezone.now() - TRENDING_EPOCH).total_seconds() / _time_constant()
+    top = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [(post_id, math.exp(log_score - offset)) for post_id, log_score in top]
@@ -2,10 +2,16 @@ from django.urls import path
 from .views import (
     BlogPostListView,
     BlogPostDetailView,
+    BlogPostTrendingView,
+    BlogPostSuggestView,
+    BlogPostViewBeaconView,
+    BlogPostAnalyticsView,
     BlogCommentCreateView,
     BlogCommentDeleteView,
     BlogCommentEditView,
     BlogCommentListBySlugView,
+    BlogCommentThreadView,
+    BlogCommentThreadRepliesView,
     BlogReplyCreateView,
     BlogReplyListView,
     BlogReplyDeleteView,
@@ -16,8 +22,14 @@ from .views import (
 urlpatterns = [
     # ──────────────── BLOG ────────────────
     path("blogs/", BlogPostListView.as_view(), name="blog-list"),
+    path("blogs/trending/", BlogPostTrendingView.as_view(), name="blog-trending"),
+    path("blogs/suggest/", BlogPostSuggestView.as_view(), name="blog-suggest"),
     path("blogs/<slug:slug>/", BlogPostDetailView.as_view(), name="blog-detail"),
 
+    # ──────────────── VIEWS ────────────────
+    path("blogs/<str:post_id>/view/", BlogPostViewBeaconView.as_view(), name="blog-view"),
+    path("blogs/<str:post_id>/analytics/", BlogPostAnalyticsView.as_view(), name="blog-analytics"),
+
     # ──────────────── LIKES ────────────────
     path("blogs/<str:post_id>/like/", BlogLikeToggleView.as_view(), name="blog-like"),
 
@@ -26,6 +38,8 @@ urlpatterns = [
     path("blogs/comments/<str:id>/edit/", BlogCommentEditView.as_view(), name="blog-comment-edit"),
     path("blogs/comments/<str:id>/delete/", BlogCommentDeleteView.as_view(), name="blog-comment-delete"),
     path("blogs/<slug:slug>/comments/", BlogCommentListBySlugView.as_view(), name="blog-comment-list"),
+    path("blogs/<slug:slug>/comments/thread/", BlogCommentThreadView.as_view(), name="blog-comment-thread"),
+    path("blogs/comments/<int:comment_id>/thread/", BlogCommentThreadRepliesView.as_view(), name="blog-comment-thread-replies"),
 
     # ──────────────── REPLIES ────────────────
     path("blogs/comments/<str:comment_id>/reply/", BlogReplyCreateView.as_view(), name="blog-reply-create"),
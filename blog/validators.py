@@ -24,6 +24,29 @@ class BlogLikeToggleData(BaseModel):
     pass
 
 
+# --------------------------
+# VIEW ANALYTICS QUERY
+# --------------------------
+class BlogAnalyticsQuery(BaseModel):
+    days: int = Field(30, ge=1, le=365)
+
+
+# --------------------------
+# THREADED COMMENTS QUERY
+# --------------------------
+class BlogCommentThreadQuery(BaseModel):
+    depth: int = Field(3, ge=0, le=20)
+    replies: int = Field(5, ge=0, le=50)
+
+
+# --------------------------
+# TITLE SUGGESTIONS QUERY
+# --------------------------
+class BlogSuggestQuery(BaseModel):
+    q: Annotated[str, Field(min_length=1, max_length=100)]
+    limit: int = Field(8, ge=1, le=20)
+
+
 # --------------------------
 # HELPER FUNCTION
 # --------------------------
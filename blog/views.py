@@ -1,32 +1,106 @@
+from datetime import timedelta
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, F
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import conditional_page
+from django.db.models import Exists, OuterRef, Sum
+from django.utils import timezone
 from django.db import transaction
 from core.utils.api_response import api_response
-from core.utils.pagination import StandardResultsSetPagination
-from .models import BlogPost, BlogLike, BlogComment, BlogReply, BlogViewer
+from core.utils.pagination import KeysetPagination, StandardResultsSetPagination
+from .models import (
+    MAX_COMMENT_DEPTH,
+    BlogFeedEntry,
+    BlogPost,
+    BlogLike,
+    BlogComment,
+    BlogReply,
+    BlogViewDaily,
+)
+from .counters import live_likes_count, with_pending_likes
+from .permissions import IsAdminUserOnly
 from .serializers import (
+    BlogFeedEntrySerializer,
     BlogPostListSerializer,
     BlogPostDetailSerializer,
     BlogCommentSerializer,
+    BlogCommentThreadSerializer,
     BlogReplySerializer,
+    BlogViewDailySerializer,
+)
+from .threads import (
+    decode_replies_cursor,
+    descendant_rows,
+    encode_replies_cursor,
+    nest,
+    thread_rows,
+)
+from .tracking import view_buffer
+from .suggest import suggest
+from .trending import top_trending
+from .validators import (
+    BlogAnalyticsQuery,
+    BlogCommentCreateData,
+    BlogCommentThreadQuery,
+    BlogLikeToggleData,
+    BlogSuggestQuery,
+    validate_or_raise,
 )
-from .validators import BlogCommentCreateData, BlogLikeToggleData, validate_or_raise
+
+
+def with_liked_flag(queryset, user):
+    """
+    Annotate ``is_liked`` for ``user`` with one EXISTS subquery, so a whole
+    page (or a detail row) learns its liked state in the same SELECT.
+    """
+    if not user.is_authenticated:
+        return queryset
+    return queryset.annotate(
+        is_liked=Exists(BlogLike.objects.filter(post=OuterRef("pk"), user=user))
+    )
 
 
 # ───────────────────────────────────────────────
-# LIST BLOG POSTS (unchanged)
+# LIST BLOG POSTS
 # ───────────────────────────────────────────────
 class BlogPostListView(generics.ListAPIView):
-    serializer_class = BlogPostListSerializer
+    """
+    Published posts, newest first or by popularity (?sort=popular).
+
+    Page-number pagination by default; ?pagination=cursor (or any
+    ?cursor=) switches to keyset pagination, which skips the COUNT(*).
+
+    Rows come from the narrow BlogFeedEntry table, never from BlogPost.
+    """
+    serializer_class = BlogFeedEntrySerializer
     permission_classes = [AllowAny]
     pagination_class = StandardResultsSetPagination
 
+    newest_ordering = ("-published_at", "-post_id")
+    popular_ordering = ("-popularity_score", "-published_at", "-post_id")
+
+    def get_ordering(self):
+        if self.request.query_params.get("sort") == "popular":
+            return self.popular_ordering
+        return self.newest_ordering
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            params = self.request.query_params
+            if params.get("pagination") == "cursor" or "cursor" in params:
+                self._paginator = KeysetPagination(self.get_ordering())
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_queryset(self):
-        queryset = BlogPost.objects.filter(is_published=True).annotate(
-            comments_count=Count("comments", distinct=True),
-            popularity=F("likes_count") + Count("comments", distinct=True),
+        queryset = with_liked_flag(
+            with_pending_likes(BlogFeedEntry.objects.all()),
+            self.request.user,
         )
 
         search = self.request.query_params.get("search")
@@ -35,10 +109,7 @@ class BlogPostListView(generics.ListAPIView):
                 excerpt__icontains=search
             ) | queryset.filter(author_name__icontains=search)
 
-        sort = self.request.query_params.get("sort")
-        if sort == "popular":
-            return queryset.order_by("-popularity", "-published_at")
-        return queryset.order_by("-published_at")
+        return queryset.order_by(*self.get_ordering())
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
@@ -53,52 +124,139 @@ class BlogPostListView(generics.ListAPIView):
 
 
 # ───────────────────────────────────────────────
-# BLOG DETAIL + TRACK VIEWERS (unchanged)
+# TRENDING BLOGS (decayed engagement, see trending.py)
 # ───────────────────────────────────────────────
+class BlogPostTrendingView(generics.GenericAPIView):
+    """
+    Top posts by time-decayed views, likes and comments. The ranking comes
+    from the cache; only the ranked posts themselves are fetched.
+    """
+    serializer_class = BlogPostListSerializer
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        ranked = top_trending()
+        posts = with_liked_flag(
+            with_pending_likes(
+                BlogPost.objects.filter(pk__in=[post_id for post_id, _ in ranked], is_published=True)
+            ),
+            request.user,
+        ).in_bulk()
+
+        ranked = [(posts[post_id], score) for post_id, score in ranked if post_id in posts]
+        data = self.get_serializer([post for post, _ in ranked], many=True).data
+        for item, (_, score) in zip(data, ranked):
+            item["trending_score"] = round(score, 3)
+
+        return api_response(data=data, message="Trending blog posts fetched successfully")
+
+
+# ───────────────────────────────────────────────
+# TITLE SUGGESTIONS (in-memory prefix index, see suggest.py)
+# ───────────────────────────────────────────────
+class BlogPostSuggestView(generics.GenericAPIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        query = validate_or_raise(request.query_params.dict(), BlogSuggestQuery)
+        return api_response(
+            data=suggest(query.q, query.limit),
+            message="Blog suggestions fetched successfully",
+        )
+
+
+# ───────────────────────────────────────────────
+# BLOG DETAIL (read-only, cacheable)
+# ───────────────────────────────────────────────
+@method_decorator(conditional_page, name="dispatch")
 class BlogPostDetailView(generics.RetrieveAPIView):
     queryset = BlogPost.objects.filter(is_published=True)
     serializer_class = BlogPostDetailSerializer
     lookup_field = "slug"
     permission_classes = [AllowAny]
 
+    def get_queryset(self):
+        return with_liked_flag(with_pending_likes(super().get_queryset()), self.request.user)
+
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
 
-        # Track viewers
+        serializer = self.get_serializer(instance)
+        data = serializer.data
+        data["liked_by_user"] = data["is_liked"]
+
+        response = api_response(data=data, message="Blog post fetched successfully")
+
+        # Anonymous responses are identical for everyone, so shared caches may
+        # keep them; ETag revalidation is handled by conditional_page.
+        visibility = "private" if request.user.is_authenticated else "public"
+        patch_cache_control(
+            response,
+            max_age=settings.BLOG_DETAIL_CACHE_MAX_AGE,
+            **{visibility: True},
+        )
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+# ───────────────────────────────────────────────
+# TRACK A VIEW (beacon, see tracking.py)
+# ───────────────────────────────────────────────
+class BlogPostViewBeaconView(generics.GenericAPIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request, post_id):
         user = request.user if request.user.is_authenticated else None
-        session_id = request.session.session_key
-        if not session_id:
-            request.session.create()
-            session_id = request.session.session_key
 
-        viewer_exists = BlogViewer.objects.filter(
-            post=instance,
-            user=user,
-            session_id=None if user else session_id
-        ).exists()
-
-        if not viewer_exists:
-            BlogViewer.objects.create(
-                post=instance,
-                user=user,
-                session_id=None if user else session_id,
-                ip_address=request.META.get("REMOTE_ADDR"),
-                user_agent=request.META.get("HTTP_USER_AGENT", ""),
-            )
-            instance.views_count = F("views_count") + 1
-            instance.save(update_fields=["views_count"])
+        session_id = None
+        if not user:
+            session_id = request.session.session_key
+            if not session_id:
+                request.session.create()
+                session_id = request.session.session_key
+
+        # Unknown or unpublished posts are dropped when the buffer is flushed
+        view_buffer.record(
+            post_id,
+            user_id=user.pk if user else None,
+            session_id=session_id,
+            ip_address=request.META.get("REMOTE_ADDR"),
+            user_agent=request.META.get("HTTP_USER_AGENT", ""),
+        )
 
-        instance.refresh_from_db()
+        return api_response(
+            message="View recorded",
+            status_code=status.HTTP_202_ACCEPTED,
+        )
 
-        liked = False
-        if request.user.is_authenticated:
-            liked = BlogLike.objects.filter(post=instance, user=request.user).exists()
 
-        serializer = self.get_serializer(instance)
-        data = serializer.data
-        data["liked_by_user"] = liked
+# ───────────────────────────────────────────────
+# VIEW ANALYTICS (staff, reads daily rollups only)
+# ───────────────────────────────────────────────
+class BlogPostAnalyticsView(generics.GenericAPIView):
+    permission_classes = [IsAdminUserOnly]
+
+    def get(self, request, post_id):
+        query = validate_or_raise(request.query_params.dict(), BlogAnalyticsQuery)
+        post = get_object_or_404(BlogPost.objects.only("id"), id=post_id)
+
+        since = timezone.localdate() - timedelta(days=query.days - 1)
+        rows = BlogViewDaily.objects.filter(post=post, date__gte=since).order_by("date")
+        totals = rows.aggregate(
+            views=Sum("views"),
+            unique_users=Sum("unique_users"),
+            unique_sessions=Sum("unique_sessions"),
+        )
 
-        return api_response(data=data, message="Blog post fetched successfully")
+        return api_response(
+            data={
+                "post_id": post.id,
+                "since": since,
+                "days": BlogViewDailySerializer(rows, many=True).data,
+                "totals": {key: value or 0 for key, value in totals.items()},
+            },
+            message="Blog analytics fetched successfully",
+        )
 
 
 # ───────────────────────────────────────────────
@@ -112,10 +270,20 @@ class BlogCommentCreateView(generics.CreateAPIView):
         post = get_object_or_404(BlogPost, id=self.kwargs["post_id"])
         validated_input = validate_or_raise(request.data, BlogCommentCreateData)
 
+        parent = None
+        if validated_input.parent_id:
+            parent = get_object_or_404(BlogComment, id=validated_input.parent_id, post=post)
+            if parent.depth + 1 > MAX_COMMENT_DEPTH:
+                return api_response(
+                    success=False,
+                    message="This thread is too deep to reply to",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+
         # Create comment
         serializer = self.get_serializer(data={"content": validated_input.content})
         serializer.is_valid(raise_exception=True)
-        comment = serializer.save(post=post, user=request.user)
+        comment = serializer.save(post=post, user=request.user, parent=parent)
 
         # Re-serialize with context so user_name & user_img_url are correct
         output_serializer = self.get_serializer(comment, context=self.get_serializer_context())
@@ -166,13 +334,91 @@ class BlogCommentListBySlugView(generics.ListAPIView):
 
     def get_queryset(self):
         post = get_object_or_404(BlogPost, slug=self.kwargs["slug"])
-        return BlogComment.objects.filter(post=post).order_by("-created_at")
+        # Top-level comments only; replies are read through the thread
+        # endpoints. BlogPost.comments_count still includes replies.
+        return BlogComment.objects.filter(post=post, depth=0).order_by("-created_at")
 
     def list(self, request, *args, **kwargs):
         serializer = self.get_serializer(self.get_queryset(), many=True)
         return api_response(data=serializer.data, message="Comments fetched successfully")
 
 
+# ───────────────────────────────────────────────
+# THREADED COMMENTS (top-level page + replies, one query)
+# ───────────────────────────────────────────────
+class BlogCommentThreadView(generics.ListAPIView):
+    serializer_class = BlogCommentThreadSerializer
+    permission_classes = [AllowAny]
+
+    def list(self, request, *args, **kwargs):
+        post = get_object_or_404(BlogPost.objects.only("id"), slug=self.kwargs["slug"])
+        query = validate_or_raise(request.query_params.dict(), BlogCommentThreadQuery)
+
+        paginator = KeysetPagination(("-id",))
+        roots = paginator.get_page_queryset(
+            BlogComment.objects.filter(post=post, depth=0), request
+        )
+
+        threads = {}
+        for row in thread_rows(roots.values("id"), query.depth, query.replies):
+            threads.setdefault(row.root_id, []).append(row)
+
+        # The root is always first in its thread (shortest path)
+        root_rows = sorted(
+            (rows[0] for rows in threads.values()),
+            key=lambda row: row.pk,
+            reverse=not paginator.reverse,
+        )
+        page = paginator.paginate_rows(root_rows)
+
+        rows, more = [], {}
+        for root in page:
+            thread = threads[root.pk]
+            if len(thread) > query.replies + 1:
+                thread = thread[:query.replies + 1]
+                more[root.pk] = encode_replies_cursor(
+                    request, root.pk, thread[-1].path, query.depth
+                )
+            rows.extend(thread)
+
+        tree = nest(rows, self.get_serializer(rows, many=True).data)
+        for node in tree:
+            node["more_replies"] = more.get(node["id"])
+
+        paginated_data = paginator.get_paginated_response(tree).data
+        return api_response(data=paginated_data, message="Comments fetched successfully")
+
+
+# ───────────────────────────────────────────────
+# MORE REPLIES OF ONE COMMENT (continues a thread)
+# ───────────────────────────────────────────────
+class BlogCommentThreadRepliesView(generics.ListAPIView):
+    serializer_class = BlogCommentThreadSerializer
+    permission_classes = [AllowAny]
+
+    def list(self, request, *args, **kwargs):
+        comment = get_object_or_404(BlogComment, id=self.kwargs["comment_id"])
+        query = validate_or_raise(request.query_params.dict(), BlogCommentThreadQuery)
+        after_path = decode_replies_cursor(request.query_params.get("cursor"))
+
+        rows = list(descendant_rows(comment, query.depth, after_path)[:query.replies + 1])
+
+        more_replies = None
+        if len(rows) > query.replies:
+            rows = rows[:query.replies]
+            more_replies = encode_replies_cursor(
+                request, comment.pk, rows[-1].path, query.depth
+            )
+
+        return api_response(
+            data={
+                "replies": nest(rows, self.get_serializer(rows, many=True).data),
+                "more_replies": more_replies,
+            },
+            message="Replies fetched successfully",
+        )
+
+
 # ───────────────────────────────────────────────
 # CREATE REPLY – FIXED: context passed
 # ───────────────────────────────────────────────
@@ -258,19 +504,16 @@ class BlogLikeToggleView(generics.GenericAPIView):
         validate_or_raise(request.data or {}, BlogLikeToggleData)
         post = get_object_or_404(BlogPost, id=post_id)
 
+        # The BlogLike signals record the change on a sharded counter
         with transaction.atomic():
             like, created = BlogLike.objects.get_or_create(post=post, user=request.user)
             if created:
-                post.likes_count = F("likes_count") + 1
                 action = "liked"
             else:
                 like.delete()
-                post.likes_count = F("likes_count") - 1
                 action = "unliked"
-            post.save(update_fields=["likes_count"])
-            post.refresh_from_db()
 
         return api_response(
-            data={"likes_count": post.likes_count},
+            data={"likes_count": live_likes_count(post.pk)},
             message=f"Blog post successfully {action}",
         )   
\ No newline at end of file
@@ -9,6 +9,9 @@ pip install -r requirements.txt
 # Run migrations
 python manage.py migrate
 
+# Table behind the "shared" cache when REDIS_URL is not set
+python manage.py createcachetable
+
 # Create superuser from env variables
 python create_super_admin.py
 
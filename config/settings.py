@@ -1,5 +1,6 @@
 from pathlib import Path
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -55,6 +56,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.middleware.PublishedFilesMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -68,7 +70,7 @@ MIDDLEWARE = [
 REST_FRAMEWORK = {
     # JWT authentication
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
     ),
 
     # Default permission
@@ -132,6 +134,30 @@ DATABASES = {
     }
 }
 
+# "default" is per process (throttling, ratelimit, author cards, ...).
+# "shared" (core.cache.shared_cache) holds the few keys every worker and
+# management command must agree on: trending scores, the suggest and
+# related-posts versions, auth user versions and, with Redis, used
+# refresh-token ids. Redis when REDIS_URL is set, otherwise the database
+# cache (table created by `python manage.py createcachetable`); readers
+# keep those lookups off the hot path either way.
+REDIS_URL = os.getenv("REDIS_URL")
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        # Entries must not be evicted early
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv("CACHE_MAX_ENTRIES", "1000000"))},
+    },
+}
+
 AUTH_USER_MODEL = 'accounts.User'
 
 # Password validation
@@ -185,3 +211,119 @@ STORAGES = {
 
 # Optional: compress static files for better performance
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+
+
+# Blog view tracking
+# Views are buffered in each worker and written in bulk every N seconds.
+# Set to 0 to write every view immediately.
+BLOG_VIEW_FLUSH_INTERVAL = int(os.getenv("BLOG_VIEW_FLUSH_INTERVAL", "10"))
+
+# Seconds browsers and shared caches may reuse a blog detail response
+BLOG_DETAIL_CACHE_MAX_AGE = int(os.getenv("BLOG_DETAIL_CACHE_MAX_AGE", "60"))
+
+# Raw BlogViewer rows older than this are purged once rolled up into
+# daily totals (python manage.py rollup_blog_views)
+BLOG_VIEWER_RETENTION_DAYS = int(os.getenv("BLOG_VIEWER_RETENTION_DAYS", "30"))
+
+# Likes are counted on this many shard rows per post and folded back into
+# BlogPost.likes_count by python manage.py fold_like_counters. 0 (the default
+# on SQLite, which locks the whole database per write, so shards would only
+# add a subquery to reads) updates likes_count directly. Run
+# fold_like_counters once after turning shards off.
+BLOG_LIKE_COUNTER_SHARDS = int(
+    os.getenv(
+        "BLOG_LIKE_COUNTER_SHARDS",
+        "0" if DATABASES["default"]["ENGINE"].endswith("sqlite3") else "8",
+    )
+)
+
+# Trending blog posts: engagement decays with this half-life, and the
+# top BLOG_TRENDING_SIZE posts are served from the cache. Rebuild the
+# scores from the database with python manage.py rebuild_trending
+BLOG_TRENDING_HALF_LIFE_HOURS = float(os.getenv("BLOG_TRENDING_HALF_LIFE_HOURS", "24"))
+BLOG_TRENDING_SIZE = int(os.getenv("BLOG_TRENDING_SIZE", "20"))
+
+# Related posts stored per blog post (python manage.py rebuild_related_posts)
+BLOG_RELATED_POSTS = int(os.getenv("BLOG_RELATED_POSTS", "5"))
+
+# Each worker keeps its own title suggestion index (blog.suggest) and looks
+# for a newer version in the shared cache at most this often
+BLOG_SUGGEST_VERSION_CHECK_SECONDS = float(os.getenv("BLOG_SUGGEST_VERSION_CHECK_SECONDS", "5"))
+
+# Generated public files (sitemaps, feeds, JSON snapshots) written at publish time and
+# served by core.middleware.PublishedFilesMiddleware
+SITE_URL = os.getenv("SITE_URL", "https://assembly-tour2.vercel.app")
+# Where this backend is reached from outside; absolute links to published
+# files (sitemap index, feed self links, snapshot manifest) start with it
+PUBLISHED_BASE_URL = os.getenv("PUBLISHED_BASE_URL", f"https://{ALLOWED_HOSTS[0]}")
+PUBLISHED_ROOT = BASE_DIR / "published"
+PUBLISHED_URL = "/published/"
+PUBLISHED_MAX_AGE = int(os.getenv("PUBLISHED_MAX_AGE", "300"))
+
+# Public read endpoints exported as versioned JSON (python manage.py
+# export_snapshots); the manifest lives at PUBLISHED_URL/snapshots/manifest.json
+SNAPSHOT_HOST = os.getenv("SNAPSHOT_HOST", ALLOWED_HOSTS[0])
+SNAPSHOT_BLOG_PAGES = int(os.getenv("SNAPSHOT_BLOG_PAGES", "3"))
+
+# Authenticated users are resolved from a slim per-worker snapshot
+# (accounts.authentication). It is re-read from the database after
+# AUTH_USER_CACHE_TTL seconds; saving the user bumps a version in the shared
+# cache, which other workers check at most every
+# AUTH_USER_VERSION_CHECK_SECONDS. Writes that bypass signals
+# (QuerySet.update(), raw SQL) are only bounded by the TTL, so keep it short.
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "60"))
+AUTH_USER_VERSION_CHECK_SECONDS = float(os.getenv("AUTH_USER_VERSION_CHECK_SECONDS", "5"))
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", "10000"))
+
+# Cloudflare Turnstile (registration). Set TURNSTILE_BACKEND to
+# core.services.turnstile_service.StubTurnstileBackend to run offline.
+TURNSTILE_SECRET_KEY = os.getenv("CLOUDFLARE_SECRET_KEY")
+TURNSTILE_BACKEND = os.getenv(
+    "TURNSTILE_BACKEND", "core.services.turnstile_service.HttpTurnstileBackend"
+)
+TURNSTILE_POOL_SIZE = int(os.getenv("TURNSTILE_POOL_SIZE", "10"))
+TURNSTILE_CONNECT_TIMEOUT = float(os.getenv("TURNSTILE_CONNECT_TIMEOUT", "2"))
+TURNSTILE_READ_TIMEOUT = float(os.getenv("TURNSTILE_READ_TIMEOUT", "3"))
+TURNSTILE_RESULT_TTL = int(os.getenv("TURNSTILE_RESULT_TTL", "300"))  # failures only
+TURNSTILE_STUB_LATENCY = float(os.getenv("TURNSTILE_STUB_LATENCY", "0"))
+
+# Used refresh tokens are denied by an in-memory denylist per worker
+# (accounts.denylist) bucketed by expiry; each bucket keeps an exact set and
+# folds into a Bloom filter when it grows past JWT_DENYLIST_EXACT_LIMIT
+# (2**20 bits, 7 hashes: ~1e-6 false positives up to ~20k denied tokens per
+# bucket)
+JWT_DENYLIST_BUCKET_SECONDS = int(os.getenv("JWT_DENYLIST_BUCKET_SECONDS", "3600"))
+JWT_DENYLIST_EXACT_LIMIT = int(os.getenv("JWT_DENYLIST_EXACT_LIMIT", "4096"))
+JWT_DENYLIST_BLOOM_BITS = int(os.getenv("JWT_DENYLIST_BLOOM_BITS", str(2**20)))
+JWT_DENYLIST_BLOOM_HASHES = int(os.getenv("JWT_DENYLIST_BLOOM_HASHES", "7"))
+# Also claim each jti in the shared cache, so reuse is caught across workers
+# and restarts. Costs a round trip per refresh, a database write without
+# Redis, hence on only with Redis unless set explicitly.
+JWT_DENYLIST_SHARED = os.getenv("JWT_DENYLIST_SHARED", "True" if REDIS_URL else "False") == "True"
+
+# Password hashing policy. New and rehashed passwords use
+# PASSWORD_HASH_ALGORITHM (pbkdf2_sha256 or scrypt, both need only the
+# standard library); the other hashers only verify older hashes, which are
+# re-encoded on the next successful login. Size the cost with
+# python manage.py benchmark_logins.
+PASSWORD_HASH_ALGORITHM = os.getenv("PASSWORD_HASH_ALGORITHM", "pbkdf2_sha256")
+# pbkdf2_sha256 only; None: Django's default
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", "0")) or None
+
+_PASSWORD_HASHERS = {
+    "pbkdf2_sha256": "accounts.hashers.PolicyPBKDF2PasswordHasher",
+    "scrypt": "django.contrib.auth.hashers.ScryptPasswordHasher",
+}
+if PASSWORD_HASH_ALGORITHM not in _PASSWORD_HASHERS:
+    raise ImproperlyConfigured(
+        f"PASSWORD_HASH_ALGORITHM must be one of {', '.join(_PASSWORD_HASHERS)}, "
+        f"not {PASSWORD_HASH_ALGORITHM!r}"
+    )
+if PASSWORD_HASH_ITERATIONS and PASSWORD_HASH_ALGORITHM != "pbkdf2_sha256":
+    # scrypt's cost is its work factor; an iteration count would be ignored
+    raise ImproperlyConfigured(
+        f"PASSWORD_HASH_ITERATIONS only applies to pbkdf2_sha256, not {PASSWORD_HASH_ALGORITHM!r}"
+    )
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASH_ALGORITHM]] + [
+    hasher for algorithm, hasher in _PASSWORD_HASHERS.items() if algorithm != PASSWORD_HASH_ALGORITHM
+] + ["django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher"]  # legacy hashes, verify only
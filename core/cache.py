@@ -0,0 +1,6 @@
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+# Cache seen by every worker and management command (CACHES["shared"]);
+# the default cache is per process
+shared_cache = ConnectionProxy(caches, "shared")
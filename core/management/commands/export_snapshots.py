@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.snapshots import SNAPSHOTS, export_snapshots
+
+
+class Command(BaseCommand):
+    help = "Render public read endpoints to versioned JSON snapshots and update the manifest"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help=f"Snapshots to export (default: all of {', '.join(SNAPSHOTS)})",
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options["names"]) - SNAPSHOTS.keys()
+        if unknown:
+            raise CommandError(f"Unknown snapshots: {', '.join(sorted(unknown))}")
+
+        written = export_snapshots(options["names"] or None)
+        self.stdout.write(self.style.SUCCESS(f"Exported {len(written)} changed snapshots"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.sitemaps import publish_all
+
+
+class Command(BaseCommand):
+    help = "Regenerate every sitemap shard, the sitemap index and the blog feeds"
+
+    def handle(self, *args, **options):
+        shards = publish_all()
+        self.stdout.write(self.style.SUCCESS(f"Published {shards} sitemap shards and the blog feeds"))
@@ -0,0 +1,58 @@
+import os
+import threading
+
+from django.conf import settings
+from whitenoise.base import WhiteNoise
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .published import VERSION_FILE, published_version
+from .snapshots import IMMUTABLE_SNAPSHOT_RE
+
+
+class PublishedFilesMiddleware:
+    """
+    Serve generated files (sitemaps, feeds, JSON snapshots) from ``PUBLISHED_ROOT`` under
+    ``PUBLISHED_URL`` before any view runs.
+
+    Other paths go straight to the view. Files are indexed by WhiteNoise
+    up front, like collected static files; since these are rewritten
+    while the server runs, the index is rebuilt whenever the version
+    marker left by ``write_published``/``remove_published`` changed, at
+    the cost of one stat per published request instead of WhiteNoise's
+    autorefresh lookups. Content-hashed snapshots are cached as immutable.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.PUBLISHED_URL
+        self._lock = threading.Lock()
+        self.files = {}
+        self.version = None
+        self._scan()
+
+    def _scan(self):
+        with self._lock:
+            version = published_version()
+            if version == self.version:
+                return
+            # Build aside and swap, so requests meanwhile use the old index
+            index = WhiteNoise(
+                application=None,
+                max_age=settings.PUBLISHED_MAX_AGE,
+                immutable_file_test=IMMUTABLE_SNAPSHOT_RE,
+            )
+            if os.path.isdir(settings.PUBLISHED_ROOT):
+                index.add_files(settings.PUBLISHED_ROOT, prefix=self.prefix)
+            index.files.pop(self.prefix + VERSION_FILE, None)
+            self.files, self.version = index.files, version
+
+    def __call__(self, request):
+        if not request.path_info.startswith(self.prefix):
+            return self.get_response(request)
+
+        if published_version() != self.version:
+            self._scan()
+        static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return WhiteNoiseMiddleware.serve(static_file, request)
+        return self.get_response(request)
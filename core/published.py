@@ -0,0 +1,68 @@
+import gzip
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+
+
+# Replaced after every write or removal; PublishedFilesMiddleware rescans
+# PUBLISHED_ROOT when it changes
+VERSION_FILE = ".version"
+
+
+def published_path(name):
+    return Path(settings.PUBLISHED_ROOT) / name
+
+
+def published_url(name):
+    return f"{settings.PUBLISHED_BASE_URL.rstrip('/')}{settings.PUBLISHED_URL}{name}"
+
+
+def _replace(path, data):
+    # Write next to the target and rename, so readers never see half a file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def published_version():
+    """Identity of the current version marker, None before anything is published."""
+    try:
+        stat = published_path(VERSION_FILE).stat()
+    except FileNotFoundError:
+        return None
+    # Every replacement is a new inode, even within one mtime tick
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def _bump_version():
+    _replace(published_path(VERSION_FILE), b"")
+
+
+def write_published(name, content):
+    """
+    Atomically write ``content`` to ``PUBLISHED_ROOT/name`` along with a
+    gzip copy, which WhiteNoise serves to clients that accept it.
+    """
+    data = content.encode() if isinstance(content, str) else content
+    path = published_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    _replace(path, data)
+    _replace(path.with_name(path.name + ".gz"), gzip.compress(data, mtime=0))
+    _bump_version()
+    return path
+
+
+def remove_published(name):
+    path = published_path(name)
+    for stale in (path, path.with_name(path.name + ".gz")):
+        stale.unlink(missing_ok=True)
+    _bump_version()
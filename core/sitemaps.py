@@ -0,0 +1,187 @@
+from datetime import datetime, timezone as dt_timezone
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+
+from blog.models import BlogFeedEntry
+from packages.models import Package
+from sacredsites.models import SacredSite
+
+from .published import published_path, published_url, remove_published, write_published
+
+SITEMAP_DIR = "sitemaps"
+SITEMAP_INDEX = "sitemap.xml"
+FEED_ITEMS = 20
+
+# Frontend routes the sitemap points crawlers at
+BLOG_POST_PATH = "/blog/{slug}"
+PACKAGE_PATH = "/packages/{id}"
+STATIC_PAGES = ("/", "/packages", "/blog", "/sacred-sites", "/faqs")
+
+UNDATED_BLOG_SHARD = "blog-undated"
+
+
+def site_url(path):
+    return f"{settings.SITE_URL.rstrip('/')}{path}"
+
+
+def _w3c(value):
+    return timezone.localtime(value).isoformat(timespec="seconds")
+
+
+def _urlset(entries):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>']
+    lines.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+    for loc, lastmod in entries:
+        lines.append(f"  <url><loc>{escape(loc)}</loc>")
+        if lastmod:
+            lines.append(f"    <lastmod>{_w3c(lastmod)}</lastmod>")
+        lines.append("  </url>")
+    lines.append("</urlset>")
+    return "\n".join(lines) + "\n"
+
+
+# ────────────────────────────────────────────────
+# SHARDS
+# ────────────────────────────────────────────────
+def blog_shard(published_at):
+    """Blog posts are sharded by publication month, e.g. ``blog-2026-10``."""
+    if published_at is None:
+        return UNDATED_BLOG_SHARD
+    return timezone.localtime(published_at).strftime("blog-%Y-%m")
+
+
+def _blog_entries(shard):
+    entries = BlogFeedEntry.objects.order_by("published_at", "post_id")
+    if shard == UNDATED_BLOG_SHARD:
+        entries = entries.filter(published_at__isnull=True)
+    else:
+        year, month = map(int, shard.removeprefix("blog-").split("-"))
+        entries = entries.filter(published_at__year=year, published_at__month=month)
+    return [
+        (site_url(BLOG_POST_PATH.format(slug=slug)), published_at)
+        for slug, published_at in entries.values_list("slug", "published_at")
+    ]
+
+
+def _package_entries():
+    return [
+        (site_url(PACKAGE_PATH.format(id=pk)), updated_at)
+        for pk, updated_at in Package.objects.order_by("pk").values_list("pk", "updated_at")
+    ]
+
+
+def _page_entries():
+    # Sacred sites are only listed on their page, so it changes with them
+    sites = SacredSite.objects.filter(is_active=True).order_by("-created_at")
+    latest = sites.values_list("created_at", flat=True).first()
+    return [(site_url(path), latest if path == "/sacred-sites" else None) for path in STATIC_PAGES]
+
+
+def write_sitemap_shard(shard):
+    """
+    Regenerate one shard file. Empty blog shards are removed rather than
+    written. Returns True when the shard exists afterwards.
+    """
+    name = f"{SITEMAP_DIR}/{shard}.xml"
+    if shard == "packages":
+        entries = _package_entries()
+    elif shard == "pages":
+        entries = _page_entries()
+    else:
+        entries = _blog_entries(shard)
+
+    if not entries and shard.startswith("blog-"):
+        remove_published(name)
+        return False
+    write_published(name, _urlset(entries))
+    return True
+
+
+def write_sitemap_index():
+    """
+    List every shard file with its modification time. Reads the shard
+    directory only, never the database.
+    """
+    directory = published_path(SITEMAP_DIR)
+    shards = sorted(directory.glob("*.xml")) if directory.exists() else []
+
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>']
+    lines.append('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+    for path in shards:
+        modified = datetime.fromtimestamp(path.stat().st_mtime, tz=dt_timezone.utc)
+        lines.append(f"  <sitemap><loc>{escape(published_url(f'{SITEMAP_DIR}/{path.name}'))}</loc>")
+        lines.append(f"    <lastmod>{_w3c(modified)}</lastmod>")
+        lines.append("  </sitemap>")
+    lines.append("</sitemapindex>")
+    write_published(SITEMAP_INDEX, "\n".join(lines) + "\n")
+
+
+# ────────────────────────────────────────────────
+# BLOG FEEDS
+# ────────────────────────────────────────────────
+def write_blog_feeds():
+    """RSS 2.0 and Atom feeds of the latest published posts."""
+    entries = BlogFeedEntry.objects.order_by("-published_at", "-post_id")[:FEED_ITEMS]
+    entries = list(entries.values("title", "slug", "excerpt", "published_at"))
+
+    for feed_class, name in ((Rss201rev2Feed, "feeds/blog.rss"), (Atom1Feed, "feeds/blog.atom")):
+        feed = feed_class(
+            title="Assembly Tour Blog",
+            link=site_url("/blog"),
+            description="Latest stories from Assembly Tour",
+            language="en",
+            feed_url=published_url(name),
+        )
+        for entry in entries:
+            link = site_url(BLOG_POST_PATH.format(slug=entry["slug"]))
+            feed.add_item(
+                title=entry["title"],
+                link=link,
+                description=entry["excerpt"],
+                pubdate=entry["published_at"],
+                unique_id=link,
+            )
+        write_published(name, feed.writeString("utf-8"))
+
+
+# ────────────────────────────────────────────────
+# ENTRY POINTS
+# ────────────────────────────────────────────────
+def publish_blog_changes(*published_at):
+    """Refresh the blog shards of the given publication dates and the feeds."""
+    for shard in {blog_shard(value) for value in published_at}:
+        write_sitemap_shard(shard)
+    write_sitemap_index()
+    write_blog_feeds()
+
+
+def publish_shard(shard):
+    write_sitemap_shard(shard)
+    write_sitemap_index()
+
+
+def publish_all():
+    """
+    Regenerate every shard, index and feed from scratch, dropping blog
+    shards that no longer have posts. Returns the number of shards.
+    """
+    months = BlogFeedEntry.objects.datetimes("published_at", "month")
+    shards = {blog_shard(month) for month in months}
+    if BlogFeedEntry.objects.filter(published_at__isnull=True).exists():
+        shards.add(UNDATED_BLOG_SHARD)
+    shards |= {"packages", "pages"}
+
+    directory = published_path(SITEMAP_DIR)
+    if directory.exists():
+        for path in directory.glob("blog-*.xml"):
+            if path.stem not in shards:
+                remove_published(f"{SITEMAP_DIR}/{path.name}")
+
+    for shard in shards:
+        write_sitemap_shard(shard)
+    write_sitemap_index()
+    write_blog_feeds()
+    return len(shards)
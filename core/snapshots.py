@@ -0,0 +1,121 @@
+import hashlib
+import json
+import threading
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django.test import RequestFactory
+from django.urls import resolve
+from django.utils import timezone
+
+from .published import published_path, published_url, remove_published, write_published
+
+SNAPSHOT_DIR = "snapshots"
+MANIFEST = f"{SNAPSHOT_DIR}/manifest.json"
+
+# Versioned snapshot names, e.g. snapshots/faqs.3f9a0c1d2e4b.json, never
+# change once written and are served as immutable
+IMMUTABLE_SNAPSHOT_RE = r"\.[0-9a-f]{12}\.json$"
+
+# Snapshot name -> public API path it renders
+SNAPSHOTS = {
+    "home-content": "/api/v1/home-content/",
+    "faqs": "/api/v1/faqs/",
+    "packages-navbar": "/api/v1/packages/navbar-overview/",
+    "sacred-sites": "/api/v1/sacred-sites/",
+    **{
+        f"blogs-page-{page}": f"/api/v1/blogs/?page={page}"
+        for page in range(1, settings.SNAPSHOT_BLOG_PAGES + 1)
+    },
+}
+BLOG_SNAPSHOTS = tuple(name for name in SNAPSHOTS if name.startswith("blogs-"))
+
+_lock = threading.Lock()
+
+
+def render_endpoint(path):
+    """
+    Run the view behind ``path`` for an anonymous GET and return the
+    rendered response. Nothing goes over the network.
+    """
+    request = RequestFactory().get(path, secure=True, SERVER_NAME=settings.SNAPSHOT_HOST)
+    request.user = AnonymousUser()
+
+    match = resolve(request.path_info)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return response
+
+
+def _read_manifest():
+    try:
+        return json.loads(published_path(MANIFEST).read_text())
+    except (FileNotFoundError, ValueError):
+        return {"snapshots": {}}
+
+
+def export_snapshots(names=None):
+    """
+    Render each snapshot (all by default) to a content-hashed JSON file
+    and point the manifest at it. The previous version of each snapshot
+    is kept for clients still holding the old manifest; older ones are
+    removed. Returns the names that were written.
+    """
+    names = list(SNAPSHOTS) if names is None else names
+    written = []
+
+    with _lock:
+        manifest = _read_manifest()
+        entries = manifest.setdefault("snapshots", {})
+
+        for name in names:
+            response = render_endpoint(SNAPSHOTS[name])
+            if response.status_code == 404:
+                # e.g. a blog page past the last one; the dynamic view answers
+                entries.pop(name, None)
+                _prune(name, keep=())
+                continue
+            if response.status_code != 200:
+                # Keep serving the last good version
+                continue
+
+            version = hashlib.sha256(response.content).hexdigest()[:12]
+            current = entries.get(name, {})
+            file_name = f"{SNAPSHOT_DIR}/{name}.{version}.json"
+            if current.get("version") == version:
+                # Same content; only PUBLISHED_BASE_URL may have moved
+                current["url"] = published_url(file_name)
+                continue
+
+            write_published(file_name, response.content)
+            _prune(name, keep=(version, current.get("version")))
+
+            entries[name] = {
+                "url": published_url(file_name),
+                "source": SNAPSHOTS[name],
+                "version": version,
+                "generated_at": timezone.now().isoformat(timespec="seconds"),
+            }
+            written.append(name)
+
+        manifest["generated_at"] = timezone.now().isoformat(timespec="seconds")
+        write_published(MANIFEST, json.dumps(manifest, indent=2, sort_keys=True))
+
+    return written
+
+
+def export_on_commit(*names):
+    """Re-export ``names`` once the current transaction commits."""
+    transaction.on_commit(lambda: export_snapshots(list(names)))
+
+
+def _prune(name, keep):
+    directory = published_path(SNAPSHOT_DIR)
+    if not directory.exists():
+        return
+    for path in directory.glob(f"{name}.*.json"):
+        version = path.name[len(name) + 1 : -len(".json")]
+        if version not in keep:
+            remove_published(f"{SNAPSHOT_DIR}/{path.name}")
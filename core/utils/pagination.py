@@ -1,5 +1,12 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 10  # default items per page
@@ -25,3 +32,159 @@ class StandardResultsSetPagination(PageNumberPagination):
             },
             "errors": None
         })
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in cursor pagination over a fixed tuple of ordering fields,
+    e.g. ("-published_at", "-id").
+
+    The cursor is an opaque token holding the ordering values of the last
+    (or first) row of a page, so each page is a range seek on the ordering
+    index. There is no COUNT(*) and no OFFSET, and rows do not shift when
+    new ones are inserted. Descending fields sort NULLs last.
+    """
+    page_size = 10
+    page_size_query_param = "limit"
+    max_page_size = 50
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self, ordering):
+        self.ordering = [
+            (name.lstrip("-"), name.startswith("-")) for name in ordering
+        ]
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_rows(list(self.get_page_queryset(queryset, request)))
+
+    def get_page_queryset(self, queryset, request):
+        """
+        The seek-filtered, ordered and sliced queryset for the requested
+        page, not yet evaluated, so it can also be used as a subquery. It
+        holds one extra row to tell whether another page follows.
+        """
+        self.request = request
+        self.model = queryset.model
+        self.size = self.get_page_size(request)
+
+        self.position, self.reverse = self.decode_cursor(request)
+        ordering = [(name, desc != self.reverse) for name, desc in self.ordering]
+
+        if self.position is not None:
+            queryset = queryset.filter(self._seek(ordering, self.position))
+        queryset = queryset.order_by(*[
+            F(name).desc(nulls_last=True) if desc else F(name).asc(nulls_first=True)
+            for name, desc in ordering
+        ])
+        return queryset[:self.size + 1]
+
+    def paginate_rows(self, rows):
+        """
+        Trim rows fetched through get_page_queryset(), in that queryset's
+        order, down to the page and work out the neighbouring links.
+        """
+        has_more = len(rows) > self.size
+        rows = rows[:self.size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = self.position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.position is not None
+
+        self.rows = rows
+        return rows
+
+    def _seek(self, ordering, position):
+        """
+        Rows strictly after ``position`` in ``ordering``, expressed as
+        (a > x) OR (a = x AND b > y) OR ... with NULL-aware comparisons.
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (name, desc), value in zip(ordering, position):
+            if value is None:
+                after = Q(pk__in=[]) if desc else Q(**{f"{name}__isnull": False})
+                same = Q(**{f"{name}__isnull": True})
+            elif desc:
+                after = Q(**{f"{name}__lt": value}) | Q(**{f"{name}__isnull": True})
+                same = Q(**{name: value})
+            else:
+                after = Q(**{f"{name}__gt": value})
+                same = Q(**{name: value})
+            condition |= equal & after
+            equal &= same
+        return condition
+
+    # -----------------------
+    # Cursor encoding
+    # -----------------------
+    def _position_of(self, row):
+        return [getattr(row, name) for name, _ in self.ordering]
+
+    def encode_cursor(self, row, reverse):
+        payload = {
+            "p": [value.isoformat() if hasattr(value, "isoformat") else value
+                  for value in self._position_of(row)],
+            "r": int(reverse),
+        }
+        token = urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+
+        try:
+            payload = json.loads(urlsafe_b64decode(token.encode()))
+            values = payload["p"]
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = [
+                None if value is None
+                else self.model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, values)
+            ]
+            return position, bool(payload.get("r"))
+        except (KeyError, TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.rows:
+            return None
+        return self.encode_cursor(self.rows[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.rows:
+            return None
+        return self.encode_cursor(self.rows[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        """
+        Same envelope as StandardResultsSetPagination; the page counters
+        are null because cursor mode never counts rows.
+        """
+        return Response({
+            "success": True,
+            "message": "Data fetched successfully",
+            "data": data,
+            "pagination": {
+                "current_page": None,
+                "total_pages": None,
+                "total_items": None,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "page_size": self.size
+            },
+            "errors": None
+        })
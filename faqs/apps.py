@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class FaqsConfig(AppConfig):
     name = 'faqs'
+
+    def ready(self):
+        import faqs.signals
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from core.snapshots import export_on_commit
+from .models import FAQ
+
+
+# =====================================================
+# RE-EXPORT THE FAQ SNAPSHOT
+# =====================================================
+@receiver(post_save, sender=FAQ)
+@receiver(post_delete, sender=FAQ)
+def export_faqs_snapshot(sender, instance, **kwargs):
+    export_on_commit("faqs")
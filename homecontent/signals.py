@@ -1,5 +1,6 @@
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from core.snapshots import export_on_commit
 from .models import HeroSlide, ExperienceSection
 
 
@@ -55,3 +56,15 @@ def replace_experience_images(sender, instance, **kwargs):
 
     if old.image_two and old.image_two != instance.image_two:
         old.image_two.delete(save=False)
+
+
+# =====================================================
+# RE-EXPORT THE HOME CONTENT SNAPSHOT
+# =====================================================
+
+@receiver(post_save, sender=HeroSlide)
+@receiver(post_delete, sender=HeroSlide)
+@receiver(post_save, sender=ExperienceSection)
+@receiver(post_delete, sender=ExperienceSection)
+def export_home_content_snapshot(sender, instance, **kwargs):
+    export_on_commit("home-content")
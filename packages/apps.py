@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class PackagesConfig(AppConfig):
     name = 'packages'
+
+    def ready(self):
+        import packages.signals
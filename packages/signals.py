@@ -0,0 +1,24 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from core.sitemaps import publish_shard
+from core.snapshots import export_on_commit
+from .models import Package
+
+
+# =====================================================
+# REGENERATE THE PACKAGES SITEMAP SHARD
+# =====================================================
+@receiver(post_save, sender=Package)
+@receiver(post_delete, sender=Package)
+def publish_packages_sitemap(sender, instance, **kwargs):
+    transaction.on_commit(lambda: publish_shard("packages"))
+
+
+# =====================================================
+# RE-EXPORT THE NAVBAR SNAPSHOT
+# =====================================================
+@receiver(post_save, sender=Package)
+@receiver(post_delete, sender=Package)
+def export_packages_snapshot(sender, instance, **kwargs):
+    export_on_commit("packages-navbar")
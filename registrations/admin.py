@@ -76,8 +76,8 @@ class RegistrationStepAdmin(admin.ModelAdmin):
 
 @admin.register(HajjRegistration)
 class HajjRegistrationAdmin(admin.ModelAdmin):
-    list_display = ("user", "current_step", "updated_at")
-    readonly_fields = ("created_at", "updated_at")
+    list_display = ("user", "current_step", "completed_count", "updated_at")
+    readonly_fields = ("completed_count", "created_at", "updated_at")
     filter_horizontal = ("completed_steps",)
 
     actions = ["move_to_next_step", "move_to_previous_step"]
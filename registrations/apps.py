@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class RegistrationsConfig(AppConfig):
     name = 'registrations'
+
+    def ready(self):
+        import registrations.signals
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:33
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_completed_steps(apps, schema_editor):
+    HajjRegistration = apps.get_model("registrations", "HajjRegistration")
+    CompletedStep = HajjRegistration.completed_steps.through
+
+    counts = (
+        CompletedStep.objects.filter(hajjregistration_id=OuterRef("pk"))
+        .order_by()
+        .values("hajjregistration_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    HajjRegistration.objects.update(completed_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registrations', '0003_alter_hajjregistration_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hajjregistration',
+            name='completed_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of completed steps, kept in sync by registrations.signals'),
+        ),
+        migrations.RunPython(count_completed_steps, migrations.RunPython.noop),
+    ]
@@ -90,6 +90,12 @@ class HajjRegistration(models.Model):
         related_name="completed_by_users"
     )
 
+    completed_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of completed steps, kept in sync by registrations.signals"
+    )
+
     status = models.CharField(
         max_length=20,
         choices=RegistrationStatus.choices,
@@ -112,7 +118,7 @@ class HajjRegistration(models.Model):
         Returns True if all active steps are completed.
         """
         total_steps = RegistrationStep.objects.filter(is_active=True).count()
-        return self.completed_steps.count() >= total_steps
+        return self.completed_count >= total_steps
 
     def update_status(self):
         """
@@ -0,0 +1,89 @@
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import HajjRegistration, RegistrationStep
+
+CompletedStep = HajjRegistration.completed_steps.through
+
+
+def sync_completed_counts(registration_ids):
+    """Recount completed steps of the given registrations in one UPDATE."""
+    counts = (
+        CompletedStep.objects.filter(hajjregistration_id=OuterRef("pk"))
+        .order_by()
+        .values("hajjregistration_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    HajjRegistration.objects.filter(pk__in=registration_ids).update(
+        completed_count=Coalesce(Subquery(counts), 0)
+    )
+
+
+class RegistrationProgress:
+    """
+    A user's registration together with every step, completion held as a
+    bitset: bit ``i`` is set when the i-th step (by order) is completed.
+    """
+
+    def __init__(self, registration, steps):
+        self.registration = registration
+        self.steps = steps
+        self.positions = {step.pk: position for position, step in enumerate(steps)}
+
+        self.completed = 0
+        self.active = 0
+        for position, step in enumerate(steps):
+            if step.is_done:
+                self.completed |= 1 << position
+            if step.is_active:
+                self.active |= 1 << position
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Load the steps with the user's completion flags in one query and
+        the registration (created at the first active step if missing) in
+        another. Returns None when no step is active.
+        """
+        done = CompletedStep.objects.filter(
+            registrationstep_id=OuterRef("pk"),
+            hajjregistration__user_id=user.pk,
+        )
+        steps = list(RegistrationStep.objects.annotate(is_done=Exists(done)).order_by("order"))
+
+        active_steps = [step for step in steps if step.is_active]
+        if not active_steps:
+            return None
+
+        registration, created = HajjRegistration.objects.select_related(
+            "current_step"
+        ).get_or_create(user=user, defaults={"current_step": active_steps[0]})
+        return cls(registration, steps)
+
+    def _bit(self, step):
+        position = self.positions.get(step.pk)
+        return 0 if position is None else 1 << position
+
+    def is_step_completed(self, step):
+        return bool(self.completed & self._bit(step))
+
+    def is_current(self, step):
+        return self.registration.current_step_id == step.pk
+
+    @property
+    def active_steps(self):
+        return [step for step in self.steps if self.active & self._bit(step)]
+
+    @property
+    def completed_steps(self):
+        return [step for step in self.steps if self.completed & self._bit(step)]
+
+    @property
+    def completed_count(self):
+        return self.completed.bit_count()
+
+    @property
+    def is_completed(self):
+        """All active steps are completed."""
+        return self.completed & self.active == self.active
@@ -18,21 +18,24 @@ class RegistrationStepSerializer(serializers.ModelSerializer):
             "is_current",
         )
 
+    # Completion comes from the RegistrationProgress in the context, so no
+    # step triggers a query of its own
+
     def get_is_completed(self, step):
-        registration = self.context.get("registration")
-        if not registration:
+        progress = self.context.get("progress")
+        if not progress:
             return False
-        return registration.completed_steps.filter(id=step.id).exists()
+        return progress.is_step_completed(step)
 
     def get_is_current(self, step):
-        registration = self.context.get("registration")
-        if not registration:
+        progress = self.context.get("progress")
+        if not progress:
             return False
-        return registration.current_step_id == step.id
+        return progress.is_current(step)
 
 class UserRegistrationProgressSerializer(serializers.ModelSerializer):
     current_step = RegistrationStepSerializer(read_only=True)
-    completed_steps = RegistrationStepSerializer(many=True, read_only=True)
+    completed_steps = serializers.SerializerMethodField()
 
     class Meta:
         model = HajjRegistration
@@ -41,15 +44,20 @@ class UserRegistrationProgressSerializer(serializers.ModelSerializer):
             "completed_steps",
         )
 
+    def get_completed_steps(self, instance):
+        progress = self.context["progress"]
+        return RegistrationStepSerializer(
+            progress.completed_steps, many=True, context=self.context
+        ).data
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
+        progress = self.context["progress"]
 
         data["meta"] = {
             "current_step_order": instance.current_step.order,
-            "completed_steps_count": instance.completed_steps.count(),
-            "is_completed": instance.completed_steps.filter(
-                id=instance.current_step_id
-            ).exists(),
+            "completed_steps_count": progress.completed_count,
+            "is_completed": progress.is_step_completed(instance.current_step),
         }
 
         return data
@@ -0,0 +1,32 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+from .models import HajjRegistration
+from .progress import sync_completed_counts
+
+
+# =====================================================
+# KEEP HajjRegistration.completed_count IN SYNC
+# =====================================================
+@receiver(m2m_changed, sender=HajjRegistration.completed_steps.through)
+def update_completed_count(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # instance is a RegistrationStep; a clear gives no pk_set, so
+        # remember who had it before the rows go
+        if action == "pre_clear":
+            instance._cleared_registration_ids = list(
+                instance.completed_by_users.values_list("pk", flat=True)
+            )
+            return
+        if action == "post_clear":
+            registration_ids = instance.__dict__.pop("_cleared_registration_ids", [])
+        elif action in ("post_add", "post_remove"):
+            registration_ids = pk_set
+        else:
+            return
+        sync_completed_counts(registration_ids)
+        return
+
+    if action in ("post_add", "post_remove", "post_clear"):
+        sync_completed_counts([instance.pk])
+        # Keep the in-memory copy right, so a later save() does not undo it
+        instance.refresh_from_db(fields=["completed_count"])
@@ -2,7 +2,7 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 
-from .models import RegistrationStep, HajjRegistration
+from .progress import RegistrationProgress
 from .serializers import UserRegistrationProgressSerializer
 from core.utils.api_response import api_response
 
@@ -11,9 +11,11 @@ class UserRegistrationStepsView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        steps = RegistrationStep.objects.filter(is_active=True).order_by("order")
+        # Two queries whatever the number of steps: steps with completion
+        # flags, then the registration
+        progress = RegistrationProgress.for_user(request.user)
 
-        if not steps.exists():
+        if progress is None:
             return api_response(
                 success=False,
                 message="Registration steps are not configured",
@@ -22,13 +24,11 @@ class UserRegistrationStepsView(APIView):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        registration, created = HajjRegistration.objects.get_or_create(
-            user=request.user,
-            defaults={"current_step": steps.first()},
+        registration = progress.registration
+        serializer = UserRegistrationProgressSerializer(
+            registration, context={"progress": progress}
         )
 
-        serializer = UserRegistrationProgressSerializer(registration)
-
         return api_response(
             success=True,
             message="Registration steps retrieved successfully",
@@ -49,10 +49,10 @@ class UserRegistrationStepsView(APIView):
                         "action_type": step.action_type,
                         "data_scope": step.data_scope,
                         "order": step.order,
-                        "is_completed": step in registration.completed_steps.all(),
-                        "is_current": step == registration.current_step,
+                        "is_completed": progress.is_step_completed(step),
+                        "is_current": progress.is_current(step),
                     }
-                    for step in steps
+                    for step in progress.active_steps
                 ],
                 "progress": serializer.data,
             },
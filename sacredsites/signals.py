@@ -1,5 +1,8 @@
-from django.db.models.signals import post_delete, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from core.sitemaps import publish_shard
+from core.snapshots import export_on_commit
 from .models import SacredSite
 
 
@@ -27,3 +30,21 @@ def replace_sacred_site_image(sender, instance, **kwargs):
 
     if old.image and old.image != instance.image:
         old.image.delete(save=False)
+
+
+# =====================================================
+# REGENERATE THE PAGES SITEMAP SHARD
+# =====================================================
+@receiver(post_save, sender=SacredSite)
+@receiver(post_delete, sender=SacredSite)
+def publish_sacred_sites_sitemap(sender, instance, **kwargs):
+    transaction.on_commit(lambda: publish_shard("pages"))
+
+
+# =====================================================
+# RE-EXPORT THE SACRED SITES SNAPSHOT
+# =====================================================
+@receiver(post_save, sender=SacredSite)
+@receiver(post_delete, sender=SacredSite)
+def export_sacred_sites_snapshot(sender, instance, **kwargs):
+    export_on_commit("sacred-sites")